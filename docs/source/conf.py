@@ -16,8 +16,8 @@ extensions = [
 ]
 
 html_theme = "sphinx_rtd_theme"
-templates_path = ["_templates"]           # 可留空目录，无需放模板
-html_static_path = ["_static"]            # 我们会把 JS/CSS 放这里
+templates_path = []                       # 没有自定义模板（_templates/ 不存在），不必扫描
+html_static_path = ["_static"]            # langswitch.js / custom.css 在这里，需保留
 language = "en"
 locale_dirs = ["locale/"]
 gettext_compact = False
@@ -1,43 +1,44 @@
+import math
+import random
+
+import pytest
+
 from algolib.numerics import set_backend, get_backend_name
 from algolib.numerics.trig import sin, cos, tan
 from algolib.maths.number_theory.prime import is_prime
 from algolib.numerics.exp import exp
 from algolib.numerics.hyper import atanh
-import math
+from algolib.algorithms.sort_demo import bubble_sort
 
-print("I'm Yuanxun")
-print("I'm Joshua")
 
-# 1) 切换到 system backend（就是用 math 库）
-set_backend("system")
-print("Backend:", get_backend_name())
-print("tan(pi/2) ~", tan(3.1415926 / 2))
-print("sin(pi/2) ~", sin(3.1415926 / 2))
-print("cos(pi/2) ~", cos(3.1415926 / 2))
+# 1) / 2) 切换 system backend（math 库）与 pure backend（trig_pure）
+@pytest.mark.parametrize("backend", ["system", "pure"])
+def test_backend_switch(backend):
+    try:
+        set_backend(backend)
+        assert get_backend_name() == backend
+        x = 3.1415926 / 2
+        assert sin(x) == pytest.approx(math.sin(x), abs=1e-12)
+        assert cos(x) == pytest.approx(math.cos(x), abs=1e-12)
+        # x is ~3.6e-8 from the pole: tan is ill-conditioned there
+        assert tan(x) == pytest.approx(math.tan(x), rel=1e-6)
+    finally:
+        set_backend("system")
 
-# 2) 切换到 pure backend（就是你自己写的 trig_pure）
-set_backend("pure")
-print("Backend:", get_backend_name())
-print("tan(pi/2) ~", tan(3.1415926 / 2))
-print("sin(pi/2) ~", sin(3.1415926 / 2))
-print("cos(pi/2) ~", cos(3.1415926 / 2))
 
 # 3) 其它库照常用
-print("is_prime(29) =", is_prime(29))
-print("is_prime(97) =", is_prime(97))
+def test_is_prime():
+    assert is_prime(29)
+    assert is_prime(97)
 
 
-from algolib.algorithms.sort_demo import bubble_sort
-import random
 # 4) Bubble sort demo
-arr = []
-
-for i in range(100):
-    arr.append(random.randint(1, 10000))
-print("Original array:", arr)
-print("Bubble sorted:", bubble_sort(arr))
-
-print(exp(3) - math.exp(3))
+def test_bubble_sort():
+    arr = random.choices(range(1, 10001), k=100)
+    assert bubble_sort(arr) == sorted(arr)
 
-print(atanh(1), atanh(0.0001))
 
+def test_exp_and_atanh():
+    assert exp(3) == pytest.approx(math.exp(3), rel=1e-15)
+    assert math.isnan(atanh(1))
+    assert atanh(0.0001) == pytest.approx(math.atanh(0.0001), rel=1e-15)
@@ -1 +1 @@
-from .rootfinding import newton
+from .rootfinding import newton, newton_poly, make_newton
@@ -1,3 +1,4 @@
 from .complex import Complex
+from .complex_array import ComplexArray
 
-__all__ = ["Complex"]
+__all__ = ["Complex", "ComplexArray"]
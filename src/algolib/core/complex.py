@@ -8,8 +8,14 @@ and algorithmic implementations. It supports algebraic form (a + bi) and polar f
 
 Notes
 -----
-- This class uses plain floats and is immutable.
+- This class uses plain floats, is immutable and stores its two fields in
+  ``__slots__`` (no per-instance ``__dict__``).
 - We intentionally avoid Python's built-in `Complex` to practice fundamentals.
+- ``complex(z)`` converts to the built-in type when speed matters more than
+  following the algorithms step by step.
+- For element-wise arithmetic on many values, prefer
+  :class:`algolib.core.complex_array.ComplexArray`, which stores the parts in
+  two flat float buffers instead of one object per number.
 
 Examples
 --------
@@ -36,14 +42,59 @@ from algolib.exceptions import (
     NotImplementedAlgolibError,
 )
 from algolib.numerics import hypot
+from algolib.numerics.constants import DBL_MIN
 from algolib.numerics.trig_pure import sin, cos
 from algolib.numerics.sqrt import newton_sqrt as sqrt
 
 
 Number = float  # for readability
 
+_INF = math.inf
 
-@dataclass(frozen=True)
+
+def _smith_div(a: float, b: float, c: float, d: float) -> Tuple[float, float]:
+    """
+    Return ``(re, im)`` of :math:`(a+bi)/(c+di)` via scaling + Smith's algorithm.
+
+    Shared by :meth:`Complex.__truediv__` and the bulk division in
+    :mod:`algolib.core.complex_array`. The caller rejects ``c == d == 0``.
+    """
+    # ---- unified scaling to avoid overflow/underflow ----
+    # |a|, |b|, |c|, |d| are computed once without abs() calls;
+    # scale = max of the four via a pairwise tournament (no max() tuple)
+    aa = a if a >= 0.0 else -a
+    ab = b if b >= 0.0 else -b
+    ac = c if c >= 0.0 else -c
+    ad = d if d >= 0.0 else -d
+    s1 = aa if aa > ab else ab
+    s2 = ac if ac > ad else ad
+    scale = s1 if s1 > s2 else s2
+    if scale > 0.0:
+        a /= scale
+        b /= scale
+        c /= scale
+        d /= scale
+        # |c / scale| == |c| / scale exactly, so no second abs() is needed
+        ac /= scale
+        ad /= scale
+    # if scale==0, the numerator is 0 and the divisor non-zero: formulas are safe as-is
+
+    if ac >= ad:
+        # |c| >= |d|
+        t = d / c  # |t| <= 1
+        denom = c + d * t  # numerically ~ (c^2 + d^2)/c
+        re = (a + b * t) / denom
+        im = (b - a * t) / denom
+    else:
+        t = c / d  # |t| <= 1
+        denom = d + c * t  # numerically ~ (c^2 + d^2)/d
+        re = (a * t + b) / denom
+        im = (b * t - a) / denom
+
+    return re, im
+
+
+@dataclass(frozen=True, slots=True)
 class Complex:
     """
     Complex number in algebraic form :math:`a + b \\mathrm{i}`.
@@ -71,21 +122,25 @@ class Complex:
         Post-initialization validation and normalization.
 
         Ensures that the real and imaginary parts are valid numbers (int or float)
-        and converts them to floats for consistency.
+        and converts them to floats for consistency. Exact ``float`` operands
+        skip straight through; arithmetic operators bypass this entirely via
+        :func:`_new`.
 
         Raises
         ------
         InvalidTypeError
         If `re` or `im` is not a real number.
         """
-        if not isinstance(self.re, (int, float)) or not isinstance(
-            self.im, (int, float)
-        ):
+        re, im = self.re, self.im
+        if type(re) is float and type(im) is float:
+            return
+
+        if not isinstance(re, (int, float)) or not isinstance(im, (int, float)):
             raise InvalidTypeError("re and im must be real numbers (int or float).")
 
         # freeze as floats (even if ints given)
-        object.__setattr__(self, "re", float(self.re))
-        object.__setattr__(self, "im", float(self.im))
+        object.__setattr__(self, "re", float(re))
+        object.__setattr__(self, "im", float(im))
 
     @staticmethod
     def from_polar(r: Number, theta: Number) -> "Complex":
@@ -121,7 +176,8 @@ class Complex:
             raise InvalidTypeError("r and theta must be real numbers (int or float).")
         if r < 0:
             raise InvalidValueError(f"radius r must be non-negative, got {r}")
-        return Complex(r * cos(theta), r * sin(theta))
+        # r is a validated real and cos/sin return floats, so the parts are floats
+        return _new(r * cos(theta), r * sin(theta))
 
     @staticmethod
     def from_cartesian(re: Number, im: Number) -> "Complex":
@@ -210,7 +266,8 @@ class Complex:
         Returns
         -------
         float
-            The modulus :math:`\sqrt{a^2 + b^2}`.
+            The modulus :math:`\sqrt{a^2 + b^2}`, computed with
+            :func:`math.hypot` (no intermediate overflow/underflow).
 
         Examples
         --------
@@ -218,13 +275,7 @@ class Complex:
         >>> z.modulus()
         5.0
         """
-        x, y = abs(self.re), abs(self.im)
-        if x < y:
-            x, y = y, x
-        if x == 0.0:  # avoid 0/0
-            return 0.0
-        r = y / x
-        return x * (1.0 + r * r) ** 0.5
+        return math.hypot(self.re, self.im)
 
     def argument(self) -> float:
         r"""
@@ -258,7 +309,7 @@ class Complex:
         >>> z.conjugate()
         Complex(re=3.0, im=-4.0)
         """
-        return Complex(self.re, -self.im)
+        return _new(self.re, -self.im)
 
     def normalized(self) -> "Complex":
         r"""
@@ -280,8 +331,14 @@ class Complex:
         >>> z.normalized()
         Complex(re=0.6, im=0.8)
         """
-        # r = math.hypot(self.re, self.im)
-        r = hypot(self.re, self.im)
+        re, im = self.re, self.im
+        # hot path: for a normal, finite modulus one division per part is
+        # already within a few ULP of the unit circle
+        r = math.hypot(re, im)
+        if DBL_MIN <= r < _INF:
+            return _new(re / r, im / r)
+        # subnormal or overflowing modulus: careful two-pass normalization
+        r = hypot(re, im)
         if r == 0.0:
             raise InvalidValueError("cannot normalize 0+0i.")
         # normalize first
@@ -293,7 +350,7 @@ class Complex:
         if m2 != 1.0 and m2 > 0.0 and math.isfinite(m2):
             adj = 1.0 / sqrt(m2)
             x, y = x * adj, y * adj
-        return Complex(x, y)
+        return _new(x, y)
 
     # ---------------------------------- algebra ---------------------------------
 
@@ -325,7 +382,7 @@ class Complex:
         """
         if not isinstance(other, Complex):
             raise InvalidTypeError("other must be Complex.")
-        return Complex(self.re + other.re, self.im + other.im)
+        return _new(self.re + other.re, self.im + other.im)
 
     def __sub__(self, other: "Complex") -> "Complex":
         """
@@ -333,7 +390,7 @@ class Complex:
         """
         if not isinstance(other, Complex):
             raise InvalidTypeError("other must be Complex.")
-        return Complex(self.re - other.re, self.im - other.im)
+        return _new(self.re - other.re, self.im - other.im)
 
     def __mul__(self, other: "Complex") -> "Complex":
         r"""
@@ -346,7 +403,7 @@ class Complex:
         if not isinstance(other, Complex):
             raise InvalidTypeError("other must be Complex.")
         a, b, c, d = self.re, self.im, other.re, other.im
-        return Complex(a * c - b * d, a * d + b * c)
+        return _new(a * c - b * d, a * d + b * c)
 
     def __truediv__(self, other: "Complex") -> "Complex":
         r"""
@@ -363,38 +420,23 @@ class Complex:
         if c == 0.0 and d == 0.0:
             raise InvalidValueError("division by zero complex.")
 
-        # ---- unified scaling to avoid overflow/underflow ----
-        scale = max(abs(a), abs(b), abs(c), abs(d))
-        if scale > 0.0:
-            a /= scale
-            b /= scale
-            c /= scale
-            d /= scale
-        # if scale==0, this means self==0 and other!=0, applying formulas directly is safe
-
-        ac = abs(c)
-        ad = abs(d)
-        if ac >= ad:
-            # |c| >= |d|
-            t = d / c  # |t| <= 1
-            denom = c + d * t  # numerically ~ (c^2 + d^2)/c
-            re = (a + b * t) / denom
-            im = (b - a * t) / denom
-        else:
-            t = c / d  # |t| <= 1
-            denom = d + c * t  # numerically ~ (c^2 + d^2)/d
-            re = (a * t + b) / denom
-            im = (b * t - a) / denom
-
-        return Complex(re, im)
+        return _new(*_smith_div(a, b, c, d))
 
     def __neg__(self) -> "Complex":
         """Unary minus."""
-        return Complex(-self.re, -self.im)
+        return _new(-self.re, -self.im)
+
+    def __complex__(self) -> complex:
+        """Builtin ``complex(z)``: convert to Python's C-level ``complex``.
+
+        For long arithmetic loops, converting once and converting back with
+        ``Complex(w.real, w.imag)`` avoids per-operation Python dispatch.
+        """
+        return complex(self.re, self.im)
 
     def __abs__(self) -> float:
         """Builtin ``abs(z)`` -> modulus."""
-        return self.modulus()
+        return math.hypot(self.re, self.im)
 
     def __pow__(self, exponent: int) -> "Complex":
         r"""
@@ -436,18 +478,19 @@ class Complex:
             pos = -exponent
             return type(self)(1.0, 0.0) / (self.__pow__(pos))
 
-        # Fast exponentiation (exponentiation by squaring)
-        result = type(self)(1.0, 0.0)
-        base = self
+        # Fast exponentiation (exponentiation by squaring) on float locals;
+        # only the final result is allocated as a Complex.
+        rr, ri = 1.0, 0.0
+        br, bi = self.re, self.im
         n = exponent
 
         while n > 0:
             if n & 1:
-                result = result * base
-            base = base * base
+                rr, ri = rr * br - ri * bi, rr * bi + ri * br
+            br, bi = br * br - bi * bi, 2.0 * br * bi
             n >>= 1
 
-        return result
+        return type(self)(rr, ri)
 
     # ------------------------------- comparisons --------------------------------
 
@@ -483,7 +526,8 @@ class Complex:
         >>> z.to_polar()
         (5.0, 0.9272952180016122)
         """
-        return (self.modulus(), self.argument())
+        re, im = self.re, self.im
+        return (math.hypot(re, im), math.atan2(im, re))
 
     # --------------------------------- display ----------------------------------
 
@@ -493,3 +537,23 @@ class Complex:
     def __str__(self) -> str:
         sign = "+" if self.im >= 0 else "-"
         return f"{self.re:.12g} {sign} {abs(self.im):.12g}i"
+
+
+_object_new = object.__new__
+_set_re = Complex.__dict__["re"].__set__
+_set_im = Complex.__dict__["im"].__set__
+
+
+def _new(re: float, im: float) -> Complex:
+    """
+    Build a :class:`Complex` from two floats without validation.
+
+    Operator results are already floats, so the dataclass ``__init__`` and
+    :meth:`Complex.__post_init__` are skipped and the slots are written
+    directly (about twice as fast as ``Complex(re, im)``). Callers must pass
+    ``float`` values; use ``Complex(re, im)`` for anything else.
+    """
+    z = _object_new(Complex)
+    _set_re(z, re)
+    _set_im(z, im)
+    return z
@@ -0,0 +1,203 @@
+# src/algolib/core/complex_array.py
+"""
+Structure-of-arrays container for many complex numbers.
+
+:class:`~algolib.core.complex.Complex` stores one Python object per number,
+so bulk arithmetic on a list of ``Complex`` pays an allocation, a type check
+and a validation for every element of every intermediate result.
+:class:`ComplexArray` instead keeps the real and imaginary parts in two
+parallel ``array('d')`` buffers and implements element-wise operations as
+single passes over those buffers.
+
+Use :class:`Complex` for individual values and readable scalar algorithms;
+use :class:`ComplexArray` when the same operation is applied to many values.
+
+Examples
+--------
+>>> za = ComplexArray([1, 3], [2, 4])
+>>> (za * za).to_list()
+[Complex(re=-3, im=4), Complex(re=-7, im=24)]
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from typing import Iterable, Iterator, List, Sequence
+
+from algolib.core.complex import Complex, _new, _smith_div
+from algolib.exceptions import InvalidTypeError, InvalidValueError
+from algolib.numerics.trig_pure import sin, cos
+
+__all__ = ["ComplexArray"]
+
+
+class ComplexArray:
+    """
+    Fixed-length sequence of complex numbers stored as two float buffers.
+
+    Parameters
+    ----------
+    re : Sequence[float]
+        Real parts.
+    im : Sequence[float]
+        Imaginary parts; must have the same length as ``re``.
+
+    Raises
+    ------
+    InvalidTypeError
+        If an element is not a real number.
+    InvalidValueError
+        If ``re`` and ``im`` differ in length.
+    """
+
+    __slots__ = ("re", "im")
+
+    def __init__(self, re: Sequence[float], im: Sequence[float]) -> None:
+        try:
+            re_buf = array("d", re)
+            im_buf = array("d", im)
+        except TypeError as e:
+            raise InvalidTypeError("re and im must contain real numbers.") from e
+        if len(re_buf) != len(im_buf):
+            raise InvalidValueError(
+                f"re and im must have the same length, got {len(re_buf)} and {len(im_buf)}"
+            )
+        self.re = re_buf
+        self.im = im_buf
+
+    @classmethod
+    def _from_buffers(cls, re: array, im: array) -> "ComplexArray":
+        """Wrap already-validated buffers of equal length without copying."""
+        out = object.__new__(cls)
+        out.re = re
+        out.im = im
+        return out
+
+    @classmethod
+    def from_complexes(cls, values: Iterable[Complex]) -> "ComplexArray":
+        """Pack an iterable of :class:`Complex` into a :class:`ComplexArray`."""
+        re = array("d")
+        im = array("d")
+        for z in values:
+            if not isinstance(z, Complex):
+                raise InvalidTypeError("values must be Complex.")
+            re.append(z.re)
+            im.append(z.im)
+        return cls._from_buffers(re, im)
+
+    @classmethod
+    def from_polar(cls, r: Sequence[float], theta: Sequence[float]) -> "ComplexArray":
+        """
+        Build ``r[k] * (cos(theta[k]) + i sin(theta[k]))`` element-wise.
+
+        Raises
+        ------
+        InvalidValueError
+            If the lengths differ or any radius is negative.
+        """
+        if len(r) != len(theta):
+            raise InvalidValueError("r and theta must have the same length.")
+        if any(rk < 0 for rk in r):
+            raise InvalidValueError("radii must be non-negative.")
+        return cls(
+            [rk * cos(tk) for rk, tk in zip(r, theta)],
+            [rk * sin(tk) for rk, tk in zip(r, theta)],
+        )
+
+    # ------------------------------- container ----------------------------------
+
+    def __len__(self) -> int:
+        return len(self.re)
+
+    def __getitem__(self, k: int) -> Complex:
+        return _new(self.re[k], self.im[k])
+
+    def __iter__(self) -> Iterator[Complex]:
+        return map(_new, self.re, self.im)
+
+    def to_list(self) -> List[Complex]:
+        """Unpack into a list of :class:`Complex`."""
+        return list(self)
+
+    # --------------------------------- algebra ----------------------------------
+
+    def _check_other(self, other: "ComplexArray") -> None:
+        if not isinstance(other, ComplexArray):
+            raise InvalidTypeError("other must be ComplexArray.")
+        if len(other.re) != len(self.re):
+            raise InvalidValueError(
+                f"length mismatch: {len(self.re)} vs {len(other.re)}"
+            )
+
+    def __add__(self, other: "ComplexArray") -> "ComplexArray":
+        """Element-wise sum."""
+        self._check_other(other)
+        return ComplexArray._from_buffers(
+            array("d", [a + c for a, c in zip(self.re, other.re)]),
+            array("d", [b + d for b, d in zip(self.im, other.im)]),
+        )
+
+    def __sub__(self, other: "ComplexArray") -> "ComplexArray":
+        """Element-wise difference."""
+        self._check_other(other)
+        return ComplexArray._from_buffers(
+            array("d", [a - c for a, c in zip(self.re, other.re)]),
+            array("d", [b - d for b, d in zip(self.im, other.im)]),
+        )
+
+    def __mul__(self, other: "ComplexArray") -> "ComplexArray":
+        r"""Element-wise product :math:`(ac - bd) + (ad + bc)i`."""
+        self._check_other(other)
+        re = array("d")
+        im = array("d")
+        for a, b, c, d in zip(self.re, self.im, other.re, other.im):
+            re.append(a * c - b * d)
+            im.append(a * d + b * c)
+        return ComplexArray._from_buffers(re, im)
+
+    def __truediv__(self, other: "ComplexArray") -> "ComplexArray":
+        """
+        Element-wise quotient with the same scaled Smith algorithm as
+        :meth:`Complex.__truediv__`.
+
+        Raises
+        ------
+        InvalidValueError
+            If any divisor element is ``0 + 0i``.
+        """
+        self._check_other(other)
+        re = array("d")
+        im = array("d")
+        for a, b, c, d in zip(self.re, self.im, other.re, other.im):
+            if c == 0.0 and d == 0.0:
+                raise InvalidValueError("division by zero complex.")
+            x, y = _smith_div(a, b, c, d)
+            re.append(x)
+            im.append(y)
+        return ComplexArray._from_buffers(re, im)
+
+    def __neg__(self) -> "ComplexArray":
+        """Element-wise unary minus."""
+        return ComplexArray._from_buffers(
+            array("d", [-a for a in self.re]), array("d", [-b for b in self.im])
+        )
+
+    def conjugate(self) -> "ComplexArray":
+        """Element-wise conjugate; the real buffer is copied unchanged."""
+        return ComplexArray._from_buffers(
+            array("d", self.re), array("d", [-b for b in self.im])
+        )
+
+    # --------------------------------- queries ----------------------------------
+
+    def modulus(self) -> List[float]:
+        """Element-wise modulus :math:`\\sqrt{a^2 + b^2}`."""
+        return list(map(math.hypot, self.re, self.im))
+
+    def argument(self) -> List[float]:
+        r"""Element-wise principal argument in :math:`(-\pi, \pi]`."""
+        return list(map(math.atan2, self.im, self.re))
+
+    def __repr__(self) -> str:
+        return f"ComplexArray(re={self.re.tolist()}, im={self.im.tolist()})"
@@ -17,6 +17,10 @@ Notes
   ``det(A) = sign * prod(diag(U))``.
 - Right-hand sides for the solver can be either a vector (length ``n``) or a
   matrix stored **by rows** with shape ``(n, nrhs)`` (each column is one RHS).
+- ``LU`` is kept as a list of ``list[float]`` rows. Flat ``array('d')``
+  storage (or ``array('d')`` rows) is smaller, but every element read boxes a
+  new ``float`` and the flat layout adds index arithmetic in the inner loop.
+  On CPython 3.11 both variants factor about 2.5x slower.
 
 References
 ----------
@@ -25,8 +29,11 @@ References
 
 from __future__ import annotations
 
+import math
 from typing import List, Sequence, Tuple
 
+_LN2 = math.log(2.0)
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -62,16 +69,60 @@ def _check_square(A: Sequence[Sequence[float]]) -> int:
     return n
 
 
-def _deepcopy_2d(A: Sequence[Sequence[float]]) -> List[List[float]]:
-    """Create a deep copy of a 2-D list-like structure."""
-    return [list(row) for row in A]
-
-
 # ---------------------------------------------------------------------------
 # Core API
 # ---------------------------------------------------------------------------
 
 
+def _lu_factor_kernel(LU: List[List[float]], piv: List[int], piv_tol: float) -> int:
+    """Doolittle elimination with partial pivoting, in place.
+
+    ``LU`` is a square list of float rows that is overwritten with the packed
+    factors, ``piv`` must hold ``range(n)`` on entry and receives the row
+    permutation. Returns the permutation parity. No validation is performed.
+    """
+    n = len(LU)
+    sign = 1
+
+    for k in range(n):
+        # Select pivot row by maximal absolute value in the current column
+        # (first maximum wins, as with max(); plain loop, no key callback)
+        piv_row = k
+        piv_abs = abs(LU[k][k])
+        for i in range(k + 1, n):
+            v = abs(LU[i][k])
+            if v > piv_abs:
+                piv_abs = v
+                piv_row = i
+        if piv_abs <= piv_tol:
+            raise ValueError(f"singular matrix: zero (or tiny) pivot at k={k}")
+
+        # Swap rows in LU and record permutation if necessary. Rows are
+        # separate lists, so this exchanges two references and moves no data;
+        # a deferred row-index permutation would save nothing here.
+        if piv_row != k:
+            LU[k], LU[piv_row] = LU[piv_row], LU[k]
+            piv[k], piv[piv_row] = piv[piv_row], piv[k]
+            sign = -sign
+
+        # Eliminate entries below the pivot (rank-1 update of the trailing block).
+        # The pivot row and column range are loop-invariant; rows whose
+        # multiplier is exactly zero (already eliminated) are left untouched.
+        row_k = LU[k]
+        pivot = row_k[k]
+        cols = range(k + 1, n)
+        for i in range(k + 1, n):
+            row_i = LU[i]
+            lik = row_i[k] / pivot
+            row_i[k] = lik
+            if lik == 0.0:
+                continue
+            for j in cols:
+                row_i[j] -= lik * row_k[j]
+
+    return sign
+
+
 def lu_factor(
     A: Sequence[Sequence[float]], *, piv_tol: float = 0.0
 ) -> Tuple[List[List[float]], List[int], int]:
@@ -108,35 +159,18 @@ def lu_factor(
     Notes
     -----
     This is the Doolittle scheme with partial pivoting (``P A = L U``).
+
+    The elimination is deliberately unblocked. Rows are independent Python
+    lists, so a right-looking blocked (``getrf``-style) variant performs the
+    same scalar operations with extra bookkeeping: interpreter overhead, not
+    cache traffic, bounds the cost here.
     """
     n = _check_square(A)
-    LU = _deepcopy_2d(A)
+    # Fresh row lists so A is never mutated. The float objects themselves are
+    # immutable and shared, so this is n list allocations, not n^2 floats.
+    LU = [list(row) for row in A]
     piv = list(range(n))
-    sign = 1
-
-    for k in range(n):
-        # Select pivot row by maximal absolute value in the current column
-        piv_row = max(range(k, n), key=lambda i: abs(LU[i][k]))
-        piv_val = LU[piv_row][k]
-        if abs(piv_val) <= piv_tol:
-            raise ValueError(f"singular matrix: zero (or tiny) pivot at k={k}")
-
-        # Swap rows in LU and record permutation if necessary
-        if piv_row != k:
-            LU[k], LU[piv_row] = LU[piv_row], LU[k]
-            piv[k], piv[piv_row] = piv[piv_row], piv[k]
-            sign = -sign
-
-        # Eliminate entries below the pivot
-        pivot = LU[k][k]
-        for i in range(k + 1, n):
-            LU[i][k] /= pivot
-            lik = LU[i][k]
-            row_i = LU[i]
-            row_k = LU[k]
-            for j in range(k + 1, n):
-                row_i[j] -= lik * row_k[j]
-
+    sign = _lu_factor_kernel(LU, piv, piv_tol)
     return LU, piv, sign
 
 
@@ -157,18 +191,50 @@ def _permute_inplace_rhs(
     Notes
     -----
     We need ``b' = P b`` to solve ``L y = P b`` followed by ``U x = y``.
-    This function reorders rows as ``b'[k] = b[piv[k]]`` using a temporary copy
-    to preserve aliasing semantics.
+    This function reorders rows as ``b'[k] = b[piv[k]]``: the gather reads the
+    old order into a temporary list, then one slice assignment replaces the
+    contents of ``b``. ``piv`` is a permutation, so for row-stored RHS every
+    row object is moved exactly once and no row copies are needed.
+    """
+    b[:] = [b[p] for p in piv]
+
+
+def _lu_solve_vec(LU: Sequence[Sequence[float]], y: List[float]) -> None:
+    """Forward and back substitution for one already permuted RHS vector.
+
+    ``y`` is overwritten with the solution. No validation is performed.
+    """
+    n = len(LU)
+
+    # Forward substitution: solve L y = x  (L has unit diagonal)
+    for k in range(n):
+        row_k = LU[k]
+        s = y[k]
+        for i in range(k):
+            s -= row_k[i] * y[i]
+        y[k] = s
+
+    # Back substitution: solve U x = y
+    for k in range(n - 1, -1, -1):
+        row_k = LU[k]
+        s = y[k]
+        for i in range(k + 1, n):
+            s -= row_k[i] * y[i]
+        y[k] = s / row_k[k]
+
+
+def _lu_solve_kernel(LU: Sequence[Sequence[float]], x: List[List[float]]) -> None:
+    """Solve for an already permuted ``(n, nrhs)`` RHS stored by rows.
+
+    ``x`` is overwritten with the solution. No validation is performed.
+    Each RHS column is solved on a flat vector with :func:`_lu_solve_vec`, so
+    the inner loops index a single list instead of ``x[i][j]``.
     """
-    n = len(piv)
-    if isinstance(b[0], list):  # multiple RHS stored by rows (n x nrhs)
-        permuted = [list(b[piv[k]]) for k in range(n)]
-        for k in range(n):
-            b[k] = permuted[k]
-    else:  # single RHS vector (length n)
-        permuted_vec = [b[piv[k]] for k in range(n)]
-        for k in range(n):
-            b[k] = permuted_vec[k]
+    for j in range(len(x[0])):
+        y = [row[j] for row in x]
+        _lu_solve_vec(LU, y)
+        for row, v in zip(x, y):
+            row[j] = v
 
 
 def lu_solve(
@@ -204,51 +270,36 @@ def lu_solve(
     -----
     Performs forward substitution (``L y = P b``) followed by back substitution
     (``U x = y``).
+
+    ``piv`` is the final row permutation, not LAPACK's 1-based ``ipiv`` swap
+    history, so the factors cannot be handed to ``getrs`` unchanged. ``P``
+    can be rebuilt as ``ipiv`` by replaying the swaps that map ``range(n)``
+    to ``piv``.
     """
     n = len(LU)
     if n == 0:
         raise ValueError("LU must be non-empty")
 
-    # Normalize RHS into a mutable (n x nrhs) list of rows
-    if isinstance(b[0], list):
-        if len(b) != n:
-            raise ValueError("b has incompatible row count")
-        nrhs = len(b[0])
-        if any(len(row) != nrhs for row in b):
-            raise ValueError("b has inconsistent column count")
-        x = [list(row) for row in b]
-    else:
+    if not isinstance(b[0], list):
+        # Single RHS: gather x <- P b straight into a flat vector and solve
         if len(b) != n:
             raise ValueError("b has incompatible size")
-        x = [[float(val)] for val in b]  # shape (n, 1)
-        nrhs = 1
+        y = [float(b[p]) for p in piv]
+        _lu_solve_vec(LU, y)
+        return y
+
+    # Multiple RHS: normalize into a mutable (n x nrhs) list of rows
+    if len(b) != n:
+        raise ValueError("b has incompatible row count")
+    nrhs = len(b[0])
+    if any(len(row) != nrhs for row in b):
+        raise ValueError("b has inconsistent column count")
+    x = [list(row) for row in b]
 
     # Apply the permutation: x <- P b
     _permute_inplace_rhs(x, piv)
 
-    # Forward substitution: solve L y = x  (L has unit diagonal)
-    for k in range(n):
-        row_k = LU[k]
-        for j in range(nrhs):
-            s = x[k][j]
-            for i in range(k):
-                s -= row_k[i] * x[i][j]
-            x[k][j] = s  # y_k
-
-    # Back substitution: solve U x = y
-    for k in reversed(range(n)):
-        row_k = LU[k]
-        diag = row_k[k]
-        for j in range(nrhs):
-            s = x[k][j]
-            for i in range(k + 1, n):
-                s -= row_k[i] * x[i][j]
-            s /= diag
-            x[k][j] = s
-
-    # Return in the same shape as input b
-    if nrhs == 1 and not isinstance(b[0], list):
-        return [row[0] for row in x]
+    _lu_solve_kernel(LU, x)
     return x
 
 
@@ -266,9 +317,61 @@ def lu_det(LU: Sequence[Sequence[float]], sign: int) -> float:
     Returns
     -------
     det : float
-        Determinant of the original matrix ``A``.
+        Determinant of the original matrix ``A``. Intermediate products are
+        kept in mantissa/exponent form, so the result only overflows (to
+        ``±inf``) or underflows when the determinant itself is out of range.
+
+    See Also
+    --------
+    lu_slogdet : Sign and log-magnitude, for determinants outside float range.
+    """
+    m, e = _diag_frexp(LU, sign)
+    try:
+        return math.ldexp(m, e)
+    except OverflowError:
+        return math.copysign(math.inf, m)
+
+
+def lu_slogdet(LU: Sequence[Sequence[float]], sign: int) -> Tuple[float, float]:
+    """
+    Compute the sign and natural log of ``|det(A)|`` from an LU factorization.
+
+    Parameters
+    ----------
+    LU : Sequence[Sequence[float]]
+        Combined LU matrix returned by :func:`lu_factor`.
+    sign : int
+        Permutation parity returned by :func:`lu_factor`.
+
+    Returns
+    -------
+    sign : float
+        ``1.0``, ``-1.0``, or ``0.0`` for a singular factor.
+    logabsdet : float
+        ``log(|det(A)|)``; ``-inf`` when ``sign == 0.0``.
+
+    Notes
+    -----
+    ``det(A) = sign * exp(logabsdet)``. This stays finite where :func:`lu_det`
+    overflows or underflows, e.g. a 50x50 factor with diagonal ``1e-10``.
+    """
+    m, e = _diag_frexp(LU, sign)
+    if m == 0.0:
+        return 0.0, -math.inf
+    return math.copysign(1.0, m), math.log(abs(m)) + e * _LN2
+
+
+def _diag_frexp(LU: Sequence[Sequence[float]], sign: int) -> Tuple[float, int]:
+    """Return ``(m, e)`` with ``sign * prod(diag(LU)) == m * 2**e``.
+
+    Each factor is split with :func:`math.frexp` before it is multiplied in,
+    and the running product is renormalized after, so subnormal entries keep
+    their bits and ``|m|`` stays in ``[0.5, 1)`` without over/underflow.
     """
-    det = float(sign)
+    m = float(sign)
+    e = 0
     for i in range(len(LU)):
-        det *= LU[i][i]
-    return det
+        fm, fe = math.frexp(LU[i][i])
+        m, k = math.frexp(m * fm)
+        e += fe + k
+    return m, e
@@ -2,12 +2,228 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, List, Sequence, Tuple, Union, overload
+from operator import mul
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
 
 from algolib.exceptions import InvalidTypeError, InvalidValueError
+from algolib.maths.algebra.lu import lu_det, lu_factor, lu_solve
 
 Number = Union[int, float]
 
+_NUMBER_TYPES = frozenset((int, float))
+
+# Inner dimension up to which the ikj row-update kernel beats the transposed
+# dot-product kernel (CPython 3.11: ikj ~10-30% faster for k <= 8, slower
+# from k = 16 on, where sum(map(...)) amortizes its call overhead). The two
+# kernels agree only to rounding: ikj sums left to right, while sum() is
+# compensated on Python >= 3.12.
+_IKJ_MAX_INNER = 8
+
+# Products with m*k*n <= _UNROLL_MAX_FLOPS get a generated, fully unrolled
+# kernel once their shape has been seen _UNROLL_AFTER times (compiling one
+# costs 0.4-4 ms, i.e. tens of generic products); at most _UNROLL_MAX_KERNELS
+# shapes are kept.
+_UNROLL_MAX_FLOPS = 1000
+_UNROLL_AFTER = 16
+_UNROLL_MAX_KERNELS = 64
+
+_Kernel = Callable[
+    [Sequence[Sequence[Number]], Sequence[Sequence[Number]]],
+    Tuple[Tuple[float, ...], ...],
+]
+_unrolled_kernels: Dict[Tuple[int, int, int], _Kernel] = {}
+_shape_hits: Dict[Tuple[int, int, int], int] = {}
+
+# |pivot| at or below which det() reports 0 and inv() reports singularity
+_SINGULAR_PIVOT = 1e-15
+
+
+def _is_triangular(rows: Sequence[Sequence[Number]]) -> bool:
+    """True if the square ``rows`` are upper or lower triangular."""
+    if all(not any(r[:i]) for i, r in enumerate(rows)):
+        return True
+    return all(not any(r[i + 1 :]) for i, r in enumerate(rows))
+
+
+def _matmul_ikj(
+    a: Sequence[Sequence[Number]], b: Sequence[Sequence[Number]]
+) -> List[List[float]]:
+    """``a @ b`` as ``out[i] += a[i][k] * b[k]``: sequential scans of ``b``'s rows."""
+    js = range(len(b[0]))
+    out = []
+    for row_a in a:
+        row = [0.0] * len(js)
+        for aik, row_b in zip(row_a, b):
+            for j in js:
+                row[j] += aik * row_b[j]
+        out.append(row)
+    return out
+
+
+def _matmul_dot(
+    a: Sequence[Sequence[Number]], b: Sequence[Sequence[Number]]
+) -> List[List[float]]:
+    """``a @ b`` as one C-level ``sum(map(mul, row, col), 0.0)`` per entry."""
+    cols = list(zip(*b))
+    return [[sum(map(mul, r, c), 0.0) for c in cols] for r in a]
+
+
+def _det_small(rows: Sequence[Sequence[Number]]) -> float:
+    """Closed-form determinant of a 2×2 or 3×3 matrix.
+
+    Applies the singular cut-off of partial-pivoting elimination without
+    running it: the pivots are recovered from the leading column, the
+    2×2 minors and the determinant, and ``0.0`` is returned as soon as one
+    has ``|pivot| <= _SINGULAR_PIVOT``.
+    """
+    if len(rows) == 2:
+        (a, b), (c, d) = rows
+        p = abs(c) if abs(c) > abs(a) else abs(a)
+        if p <= _SINGULAR_PIVOT:
+            return 0.0
+        det = float(a * d - b * c)
+        # second pivot is det / (±p)
+        return 0.0 if abs(det) <= _SINGULAR_PIVOT * p else det
+    # first pivot: first row with the largest |a_i0|; rows keep lu_factor's
+    # order after the swap, so the second pivot search sees ``rest``
+    r0, r1, r2 = rows
+    c0, c1, c2 = abs(r0[0]), abs(r1[0]), abs(r2[0])
+    if c1 > c0 and c1 >= c2:
+        pr, rest, p = r1, (r0, r2), c1
+    elif c2 > c0 and c2 > c1:
+        pr, rest, p = r2, (r1, r0), c2
+    else:
+        pr, rest, p = r0, (r1, r2), c0
+    if p <= _SINGULAR_PIVOT:
+        return 0.0
+    # candidate second pivots times the first: a_p0 * a_i1 - a_i0 * a_p1
+    m = abs(pr[0] * rest[0][1] - rest[0][0] * pr[1])
+    m2 = abs(pr[0] * rest[1][1] - rest[1][0] * pr[1])
+    if m2 > m:
+        m = m2
+    if m <= _SINGULAR_PIVOT * p:
+        return 0.0
+    (a, b, c), (d, e, f), (g, h, i) = rows
+    det = float(a * (e * i - f * h) - b * (d * i - f * g) + c * (d * h - e * g))
+    # third pivot is det / (±first * second) = det / (±m)
+    return 0.0 if abs(det) <= _SINGULAR_PIVOT * m else det
+
+
+def _inv_small(
+    rows: Sequence[Sequence[Number]], det: float
+) -> Tuple[Tuple[float, ...], ...]:
+    """Inverse of a nonsingular 2×2 or 3×3 matrix as adjugate / ``det``."""
+    r = 1.0 / det
+    if len(rows) == 2:
+        (a, b), (c, d) = rows
+        return ((d * r, -b * r), (-c * r, a * r))
+    (a, b, c), (d, e, f), (g, h, i) = rows
+    return (
+        ((e * i - f * h) * r, (c * h - b * i) * r, (b * f - c * e) * r),
+        ((f * g - d * i) * r, (a * i - c * g) * r, (c * d - a * f) * r),
+        ((d * h - e * g) * r, (b * g - a * h) * r, (a * e - b * d) * r),
+    )
+
+
+def _matmul_small(
+    a: Sequence[Sequence[Number]], b: Sequence[Sequence[Number]]
+) -> Tuple[Tuple[float, ...], ...]:
+    """Fully unrolled product of two 2×2 or two 3×3 matrices."""
+    if len(a) == 2:
+        (a00, a01), (a10, a11) = a
+        (b00, b01), (b10, b11) = b
+        return (
+            (0.0 + a00 * b00 + a01 * b10, 0.0 + a00 * b01 + a01 * b11),
+            (0.0 + a10 * b00 + a11 * b10, 0.0 + a10 * b01 + a11 * b11),
+        )
+    (a00, a01, a02), (a10, a11, a12), (a20, a21, a22) = a
+    (b00, b01, b02), (b10, b11, b12), (b20, b21, b22) = b
+    return (
+        (
+            0.0 + a00 * b00 + a01 * b10 + a02 * b20,
+            0.0 + a00 * b01 + a01 * b11 + a02 * b21,
+            0.0 + a00 * b02 + a01 * b12 + a02 * b22,
+        ),
+        (
+            0.0 + a10 * b00 + a11 * b10 + a12 * b20,
+            0.0 + a10 * b01 + a11 * b11 + a12 * b21,
+            0.0 + a10 * b02 + a11 * b12 + a12 * b22,
+        ),
+        (
+            0.0 + a20 * b00 + a21 * b10 + a22 * b20,
+            0.0 + a20 * b01 + a21 * b11 + a22 * b21,
+            0.0 + a20 * b02 + a21 * b12 + a22 * b22,
+        ),
+    )
+
+
+def _build_unrolled_matmul(m: int, k: int, n: int) -> _Kernel:
+    """Compile ``a @ b`` for an (m×k)·(k×n) product with every index fixed.
+
+    The rows are unpacked into locals once, so each entry is a straight
+    sum of products with no indexing or loop overhead. Each entry is summed
+    exactly like the generic kernel this shape would otherwise use (left to
+    right as in :func:`_matmul_ikj`, or :func:`sum` over the products as in
+    :func:`_matmul_dot`, which is compensated on Python >= 3.12), so the
+    result does not depend on whether the kernel has been built yet.
+    """
+
+    def unpack(prefix: str, n_rows: int, n_cols: int) -> str:
+        rows = (
+            "(" + "".join(f"{prefix}{i}_{j}, " for j in range(n_cols)) + ")"
+            for i in range(n_rows)
+        )
+        return "(" + "".join(r + ", " for r in rows) + ")"
+
+    if k <= _IKJ_MAX_INNER:
+        entry = "0.0" + "".join(f" + a{{i}}_{p} * b{p}_{{j}}" for p in range(k))
+    else:
+        entry = (
+            "sum(("
+            + "".join(f"a{{i}}_{p} * b{p}_{{j}}, " for p in range(k))
+            + "), 0.0)"
+        )
+    out = (
+        "(" + "".join(entry.format(i=i, j=j) + ", " for j in range(n)) + ")"
+        for i in range(m)
+    )
+    src = (
+        "def kernel(a, b):\n"
+        f"    {unpack('a', m, k)} = a\n"
+        f"    {unpack('b', k, n)} = b\n"
+        f"    return ({''.join(r + ', ' for r in out)})\n"
+    )
+    namespace: Dict[str, _Kernel] = {}
+    exec(compile(src, f"<matmul {m}x{k}x{n}>", "exec"), namespace)
+    return namespace["kernel"]
+
+
+def _unrolled_matmul(m: int, k: int, n: int) -> Optional[_Kernel]:
+    """Return the unrolled kernel for this shape, or None if not (yet) worth it."""
+    shape = (m, k, n)
+    kernel = _unrolled_kernels.get(shape)
+    if kernel is not None:
+        return kernel
+    if m * k * n > _UNROLL_MAX_FLOPS or len(_unrolled_kernels) >= _UNROLL_MAX_KERNELS:
+        return None
+    hits = _shape_hits.get(shape, 0) + 1
+    if hits < _UNROLL_AFTER:
+        _shape_hits[shape] = hits
+        return None
+    _shape_hits.pop(shape, None)
+    kernel = _unrolled_kernels[shape] = _build_unrolled_matmul(m, k, n)
+    return kernel
+
 
 @dataclass(frozen=True)
 class MatrixDense:
@@ -17,6 +233,10 @@ class MatrixDense:
     Designed for correctness and clarity (teaching/learning oriented).
     Not optimized for large-scale numerical workloads.
 
+    Instances are immutable, so :meth:`T`, :meth:`det` and :meth:`inv` memoize
+    their results on the instance (outside the ``rows`` field; equality and
+    hashing are unaffected).
+
     Parameters
     ----------
     rows : Sequence[Sequence[Number]]
@@ -56,13 +276,28 @@ class MatrixDense:
                 raise InvalidValueError(
                     "matrix must be rectangular (same number of columns per row)."
                 )
-            # check elements are numbers
-            for x in r:
-                if not isinstance(x, (int, float)):
-                    raise InvalidTypeError("matrix elements must be int or float.")
-            norm_rows.append(tuple(x for x in r))
+            # check elements are numbers: exact int/float rows pass with one
+            # C-level scan of their types; only rows holding other types
+            # (e.g. bool or float subclasses) fall back to isinstance
+            if not _NUMBER_TYPES.issuperset(map(type, r)):
+                for x in r:
+                    if not isinstance(x, (int, float)):
+                        raise InvalidTypeError("matrix elements must be int or float.")
+            norm_rows.append(tuple(r))
         object.__setattr__(self, "rows", tuple(norm_rows))
 
+    @classmethod
+    def _from_validated(
+        cls, rows: Tuple[Tuple[Number, ...], ...]
+    ) -> "MatrixDense":
+        """Wrap a non-empty, rectangular tuple of numeric tuples without checks.
+
+        For results of internal operations whose operands were validated.
+        """
+        self = cls.__new__(cls)
+        object.__setattr__(self, "rows", rows)
+        return self
+
     @staticmethod
     def from_rows(rows: Sequence[Sequence[Number]]) -> "MatrixDense":
         """Construct from row-major data (alias of the constructor)."""
@@ -96,7 +331,7 @@ class MatrixDense:
 
     def copy(self) -> "MatrixDense":
         """Shallow copy (rows are tuples; safe)."""
-        return MatrixDense([list(r) for r in self.rows])
+        return MatrixDense._from_validated(self.rows)
 
     # ---------- Equality (tolerant for floats) ----------
 
@@ -118,15 +353,21 @@ class MatrixDense:
     def __add__(self, other: "MatrixDense") -> "MatrixDense":
         """Matrix addition."""
         self._check_same_shape(other)
-        return MatrixDense(
-            [[a + b for a, b in zip(ra, rb)] for ra, rb in zip(self.rows, other.rows)]
+        return MatrixDense._from_validated(
+            tuple(
+                tuple([a + b for a, b in zip(ra, rb)])
+                for ra, rb in zip(self.rows, other.rows)
+            )
         )
 
     def __sub__(self, other: "MatrixDense") -> "MatrixDense":
         """Matrix subtraction."""
         self._check_same_shape(other)
-        return MatrixDense(
-            [[a - b for a, b in zip(ra, rb)] for ra, rb in zip(self.rows, other.rows)]
+        return MatrixDense._from_validated(
+            tuple(
+                tuple([a - b for a, b in zip(ra, rb)])
+                for ra, rb in zip(self.rows, other.rows)
+            )
         )
 
     @overload
@@ -143,7 +384,9 @@ class MatrixDense:
         - If `other` is a MatrixDense: matrix-matrix product.
         """
         if isinstance(other, (int, float)):
-            return MatrixDense([[a * other for a in r] for r in self.rows])
+            return MatrixDense._from_validated(
+                tuple(tuple([a * other for a in r]) for r in self.rows)
+            )
         if isinstance(other, MatrixDense):
             a_rows, a_cols = self.shape
             b_rows, b_cols = other.shape
@@ -151,17 +394,18 @@ class MatrixDense:
                 raise InvalidValueError(
                     f"incompatible shapes for matmul: {self.shape} * {other.shape}"
                 )
-            out = []
-            # naive triple loop (clear & correct)
-            for i in range(a_rows):
-                row = []
-                for j in range(b_cols):
-                    s = 0.0
-                    for k in range(a_cols):
-                        s += self.rows[i][k] * other.rows[k][j]
-                    row.append(s)
-                out.append(row)
-            return MatrixDense(out)
+            if a_rows == a_cols == b_cols <= 3 and a_cols > 1:
+                return MatrixDense._from_validated(
+                    _matmul_small(self.rows, other.rows)
+                )
+            kernel = _unrolled_matmul(a_rows, a_cols, b_cols)
+            if kernel is not None:
+                return MatrixDense._from_validated(kernel(self.rows, other.rows))
+            if a_cols <= _IKJ_MAX_INNER:
+                out = _matmul_ikj(self.rows, other.rows)
+            else:
+                out = _matmul_dot(self.rows, other.rows)
+            return MatrixDense._from_validated(tuple(map(tuple, out)))
         raise InvalidTypeError(
             "unsupported operand for *: MatrixDense and non-(number|MatrixDense)"
         )
@@ -190,98 +434,94 @@ class MatrixDense:
         for x in v:
             if not isinstance(x, (int, float)):
                 raise InvalidTypeError("vector elements must be numbers.")
-        out: List[float] = []
-        for i in range(n_rows):
-            s = 0.0
-            for j in range(n_cols):
-                s += self.rows[i][j] * v[j]
-            out.append(s)
-        return out
+        return [sum(map(mul, r, v), 0.0) for r in self.rows]
 
     # ---------- Linear algebra helpers (small n) ----------
 
     def T(self) -> "MatrixDense":
-        """Transpose."""
-        n_rows, n_cols = self.shape
-        return MatrixDense(
-            [[self.rows[i][j] for i in range(n_rows)] for j in range(n_cols)]
-        )
+        """Transpose (memoized; ``A.T().T()`` returns ``A`` itself)."""
+        t = self.__dict__.get("_T")
+        if t is None:
+            # zip(*rows) walks the columns in C; each column is already a tuple
+            t = MatrixDense._from_validated(tuple(zip(*self.rows)))
+            object.__setattr__(t, "_T", self)
+            object.__setattr__(self, "_T", t)
+        return t
 
     def det(self) -> float:
         """
         Determinant via Gaussian elimination with partial pivoting (O(n^3)).
 
+        Uses :func:`~algolib.maths.algebra.lu.lu_factor`; a pivot with
+        ``|pivot| <= 1e-15`` is treated as singular and yields ``0.0``.
+        2×2 and 3×3 matrices use the closed-form (cofactor) determinant
+        under the same cut-off; larger upper or lower triangular matrices
+        skip the elimination: the determinant is the diagonal product
+        (``0.0`` if any diagonal entry is that small).
+
         Raises
         ------
         InvalidValueError
             If matrix is not square.
         """
+        cached = self.__dict__.get("_det")
+        if cached is not None:
+            return cached
         n, m = self.shape
         if n != m:
             raise InvalidValueError("determinant is defined for square matrices.")
-        # Work on a mutable copy
-        a = [list(r) for r in self.rows]
-        sign = 1.0
-        det_val = 1.0
-        for i in range(n):
-            # pivot
-            pivot_row = max(range(i, n), key=lambda r: abs(a[r][i]))
-            if abs(a[pivot_row][i]) < 1e-15:
-                return 0.0
-            if pivot_row != i:
-                a[i], a[pivot_row] = a[pivot_row], a[i]
-                sign *= -1.0
-            pivot = a[i][i]
-            det_val *= pivot
-            # eliminate
-            for r in range(i + 1, n):
-                factor = a[r][i] / pivot
-                if factor == 0:
-                    continue
-                for c in range(i, n):
-                    a[r][c] -= factor * a[i][c]
-        return float(sign * det_val)
+        rows = self.rows
+        if n in (2, 3):
+            d = _det_small(rows)
+        elif _is_triangular(rows):
+            # O(n^2): the diagonal already holds the pivots
+            if any(abs(rows[i][i]) <= _SINGULAR_PIVOT for i in range(n)):
+                d = 0.0
+            else:
+                d = lu_det(rows, 1)
+        else:
+            try:
+                LU, _, sign = lu_factor(rows, piv_tol=_SINGULAR_PIVOT)
+            except ValueError:
+                d = 0.0
+            else:
+                d = lu_det(LU, sign)
+        object.__setattr__(self, "_det", d)
+        return d
 
     def inv(self) -> "MatrixDense":
         """
-        Inverse via Gauss-Jordan elimination (O(n^3)).
+        Inverse via LU factorization with partial pivoting (O(n^3)).
+
+        Factors once with :func:`~algolib.maths.algebra.lu.lu_factor` and
+        solves for all columns of the identity with
+        :func:`~algolib.maths.algebra.lu.lu_solve`. 2×2 and 3×3 matrices
+        use the closed-form adjugate divided by :meth:`det` instead.
 
         Raises
         ------
         InvalidValueError
             If matrix is not square or singular.
         """
+        cached = self.__dict__.get("_inv")
+        if cached is not None:
+            return cached
         n, m = self.shape
         if n != m:
             raise InvalidValueError("inverse is defined for square matrices.")
-        # augmented [A | I]
-        A = [
-            list(row) + [1.0 if i == j else 0.0 for j in range(n)]
-            for i, row in enumerate(self.rows)
-        ]
-
-        # Gauss-Jordan with partial pivoting
-        for col in range(n):
-            # pivot
-            pivot_row = max(range(col, n), key=lambda r: abs(A[r][col]))
-            if abs(A[pivot_row][col]) < 1e-15:
+        if n in (2, 3):
+            d = self.det()
+            if d == 0.0:
                 raise InvalidValueError("matrix is singular; cannot invert.")
-            if pivot_row != col:
-                A[col], A[pivot_row] = A[pivot_row], A[col]
-            pivot = A[col][col]
-            # normalize pivot row
-            inv_p = 1.0 / pivot
-            for j in range(2 * n):
-                A[col][j] *= inv_p
-            # eliminate other rows
-            for r in range(n):
-                if r == col:
-                    continue
-                factor = A[r][col]
-                if factor == 0:
-                    continue
-                for j in range(2 * n):
-                    A[r][j] -= factor * A[col][j]
-
-        inv_rows = [row[n:] for row in A]
-        return MatrixDense(inv_rows)
+            result = MatrixDense._from_validated(_inv_small(self.rows, d))
+            object.__setattr__(self, "_inv", result)
+            return result
+        try:
+            LU, piv, _ = lu_factor(self.rows, piv_tol=_SINGULAR_PIVOT)
+        except ValueError:
+            raise InvalidValueError("matrix is singular; cannot invert.") from None
+        eye = [[1.0 if i == j else 0.0 for j in range(n)] for i in range(n)]
+        inv_rows = lu_solve(LU, piv, eye)
+        result = MatrixDense._from_validated(tuple(map(tuple, inv_rows)))
+        object.__setattr__(self, "_inv", result)
+        return result
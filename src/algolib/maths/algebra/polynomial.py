@@ -22,6 +22,7 @@ True
 from __future__ import annotations
 
 from dataclasses import dataclass
+from itertools import zip_longest
 from typing import Iterable, Sequence, Tuple, Union
 
 from algolib.exceptions import InvalidTypeError, InvalidValueError
@@ -52,15 +53,15 @@ def _strip_trailing_zeros(cs: Sequence[Number]) -> Tuple[float, ...]:
     return tuple(out)
 
 
-def _horner_kahan(coeffs: Sequence[Number], x: Number) -> Number:
-    """Evaluate ``p(x)`` via Horner's method with Kahan compensation for the
-    accumulating sum.
+def _horner(coeffs: Sequence[Number], x: Number) -> Number:
+    """Evaluate ``p(x)`` via Horner's method, ``s = s*x + c_k``.
 
     Notes
     -----
-    The Kahan term stabilizes the *addition* in each fused step ``s*x + c_k``.
-    This is a lightweight compromise that improves accuracy for floating‑point
-    inputs without adding significant overhead.
+    One multiply and one add per coefficient. A Kahan-style correction on the
+    addition alone does not help here: the carried error would have to be
+    scaled by ``x`` at every step (compensated Horner), otherwise it is no
+    more accurate than the plain recurrence.
 
     Parameters
     ----------
@@ -74,21 +75,14 @@ def _horner_kahan(coeffs: Sequence[Number], x: Number) -> Number:
     Number
         The evaluated value ``p(x)``.
     """
-    n = len(coeffs)
-    if n == 1:
-        return float(coeffs[0])
-    s: Number = float(coeffs[-1])
-    c: Number = 0.0
-    for k in range(n - 2, -1, -1):
-        prod = s * x
-        y = float(coeffs[k]) - c
-        t = prod + y
-        c = (t - prod) - y
-        s = t
+    it = reversed(coeffs)
+    s: Number = float(next(it))
+    for ck in it:
+        s = s * x + ck
     return s
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True)
 class Polynomial:
     """
     Univariate polynomial with real coefficients.
@@ -145,6 +139,16 @@ class Polynomial:
             i -= 1
         object.__setattr__(self, "coeffs", tuple(tmp[: i + 1]))
 
+    @classmethod
+    def _from_validated(cls, cs: Sequence[float]) -> "Polynomial":
+        """Build from non-empty ``float`` coefficients without type checks.
+
+        For results of internal operations; trailing zeros are still stripped.
+        """
+        self = object.__new__(cls)
+        object.__setattr__(self, "coeffs", _strip_trailing_zeros(cs))
+        return self
+
     @staticmethod
     def zeros(deg: int) -> "Polynomial":
         """
@@ -194,10 +198,9 @@ class Polynomial:
         Returns
         -------
         float or complex
-            The value ``p(x)`` computed via Horner's method with lightweight
-            Kahan compensation.
+            The value ``p(x)`` computed via Horner's method.
         """
-        return _horner_kahan(self.coeffs, x)
+        return _horner(self.coeffs, x)
 
     # -------------------------------- calculus ----------------------------------
 
@@ -209,12 +212,20 @@ class Polynomial:
         -----
         If :math:`p(x) = a_0 + a_1 x + \cdots + a_n x^n`, then
         :math:`p'(x) = a_1 + 2 a_2 x + \cdots + n a_n x^{n-1}`.
-        """
 
-        if self.degree == 0:
-            return Polynomial([0.0])
-        der = [k * self.coeffs[k] for k in range(1, len(self.coeffs))]
-        return Polynomial(der)
+        The result is computed once and memoized on this (immutable) instance.
+        """
+        d = self.__dict__.get("_derivative")
+        if d is None:
+            if self.degree == 0:
+                d = Polynomial._from_validated((0.0,))
+            else:
+                cs = self.coeffs
+                d = Polynomial._from_validated(
+                    [k * cs[k] for k in range(1, len(cs))]
+                )
+            object.__setattr__(self, "_derivative", d)
+        return d
 
     def integral(self, c0: Number = 0.0) -> "Polynomial":
         r"""
@@ -232,31 +243,29 @@ class Polynomial:
         """
         out = [float(c0)]
         out.extend(c / (k + 1.0) for k, c in enumerate(self.coeffs))
-        return Polynomial(out)
+        return Polynomial._from_validated(out)
 
     # --------------------------------- algebra ----------------------------------
 
     def __add__(self, other: "Polynomial") -> "Polynomial":
         if not isinstance(other, Polynomial):
             raise InvalidTypeError("other must be Polynomial")
-        n = max(self.degree, other.degree) + 1
-        cs = [0.0] * n
-        for i, c in enumerate(self.coeffs):
-            cs[i] += c
-        for i, c in enumerate(other.coeffs):
-            cs[i] += c
-        return Polynomial(cs)
+        return Polynomial._from_validated(
+            [
+                a + b
+                for a, b in zip_longest(self.coeffs, other.coeffs, fillvalue=0.0)
+            ]
+        )
 
     def __sub__(self, other: "Polynomial") -> "Polynomial":
         if not isinstance(other, Polynomial):
             raise InvalidTypeError("other must be Polynomial")
-        n = max(self.degree, other.degree) + 1
-        cs = [0.0] * n
-        for i, c in enumerate(self.coeffs):
-            cs[i] += c
-        for i, c in enumerate(other.coeffs):
-            cs[i] -= c
-        return Polynomial(cs)
+        return Polynomial._from_validated(
+            [
+                a - b
+                for a, b in zip_longest(self.coeffs, other.coeffs, fillvalue=0.0)
+            ]
+        )
 
     def __mul__(self, other: "Polynomial") -> "Polynomial":
         if not isinstance(other, Polynomial):
@@ -266,7 +275,7 @@ class Polynomial:
         for i, ai in enumerate(self.coeffs):
             for j, bj in enumerate(other.coeffs):
                 out[i + j] += ai * bj
-        return Polynomial(out)
+        return Polynomial._from_validated(out)
 
     # --------------------------------- display ----------------------------------
 
@@ -10,6 +10,9 @@ It implements:
 - **Plane**: hyperplane :math:`\{X:\; n\cdot(X-P_0)=0\}`.
 - **GeometryUtils**: utility routines.
 
+Batch kernels over coordinate columns live in
+:mod:`algolib.maths.geometry.soa`.
+
 All classes validate dimensions and numeric inputs, and raise
 :class:`algolib.exceptions.InvalidTypeError` or
 :class:`algolib.exceptions.InvalidValueError` on invalid usage.
@@ -17,17 +20,19 @@ All classes validate dimensions and numeric inputs, and raise
 
 from __future__ import annotations
 
+import math
+from math import dist as _dist, fsum as _fsum, hypot as _hypot
+from operator import add, mul, sub
 from typing import Iterable, List, Sequence, Union
 
 from algolib.exceptions import InvalidTypeError, InvalidValueError
-from algolib.numerics.stable import hypot, hypot_n, hypot_iter
 
 Number = Union[int, float]
 
 
 def _ensure_numbers(xs: Iterable[Number]) -> List[float]:
     try:
-        out = [float(x) for x in xs]
+        out = list(map(float, xs))
     except Exception as e:  # noqa: BLE001
         raise InvalidTypeError(
             "all coordinates/components must be real numbers."
@@ -41,7 +46,51 @@ def _same_dim(a_len: int, b_len: int) -> None:
 
 
 def _is_zero_vector(v: Sequence[float]) -> bool:
-    return all(c == 0.0 for c in v)
+    # NaN is truthy, so it counts as non-zero exactly like ``c == 0.0`` did
+    return not any(v)
+
+
+def _dot(u: Sequence[float], v: Sequence[float]) -> float:
+    """Dot product of equal-length float sequences (see :meth:`Vector.dot`)."""
+    # Fast path: fsum is exact over the rounded products, so it is at
+    # least as accurate as the compensated loop below. Non-finite results
+    # (NaN, inf or 0 * inf terms, intermediate overflow) take that loop.
+    try:
+        total = _fsum(map(mul, u, v))
+    except (ValueError, OverflowError):
+        total = math.nan
+    if total - total == 0.0:
+        return total
+    total = 0.0
+    c = 0.0
+    for a, b in zip(u, v):
+        # NaN propagation: if either input is NaN, the dot is NaN
+        if a != a or b != b:  # NaN check
+            return float("nan")
+
+        # Handle indeterminate 0 * inf (or inf * 0) as contributing 0.0
+        if (a == 0.0 and (b == float("inf") or b == float("-inf"))) or (
+            b == 0.0 and (a == float("inf") or a == float("-inf"))
+        ):
+            # mathematically this term is 0; avoid NaN from IEEE 0*inf
+            continue
+
+        prod = a * b
+        # Kahan summation: add with compensation
+        y = prod - c
+        t = total + y
+        c = (t - total) - y
+        total = t
+    return total
+
+
+def _distance(a: Sequence[float], b: Sequence[float]) -> float:
+    """:func:`math.dist` with the NaN-first rule of :meth:`Vector.norm`."""
+    # math.dist gives inf precedence over NaN (like hypot), so restore NaN
+    r = _dist(a, b)
+    if r == math.inf and any(d != d for d in map(sub, a, b)):
+        return math.nan
+    return r
 
 
 class Point:
@@ -59,12 +108,21 @@ class Point:
     :math:`P=(x_1,x_2,\cdots,x_N)`.
     """
 
+    __slots__ = ("coords",)
+
     def __init__(self, coords: Sequence[Number]):
         cs = _ensure_numbers(coords)
         if len(cs) == 0:
             raise InvalidValueError("point must have at least one coordinate.")
         self.coords: List[float] = cs
 
+    @classmethod
+    def _from_validated(cls, cs: List[float]) -> "Point":
+        """Wrap a non-empty list of floats without re-validating it."""
+        self = cls.__new__(cls)
+        self.coords = cs
+        return self
+
     def __repr__(self) -> str:  # pragma: no cover - trivial
         return f"Point({self.coords})"
 
@@ -87,12 +145,21 @@ class Vector:
     A vector represents both magnitude and direction.
     """
 
+    __slots__ = ("comps",)
+
     def __init__(self, comps: Sequence[Number]):
         cs = _ensure_numbers(comps)
         if len(cs) == 0:
             raise InvalidValueError("vector must have at least one component.")
         self.comps: List[float] = cs
 
+    @classmethod
+    def _from_validated(cls, cs: List[float]) -> "Vector":
+        """Wrap a non-empty list of floats without re-validating it."""
+        self = cls.__new__(cls)
+        self.comps = cs
+        return self
+
     def __repr__(self) -> str:  # pragma: no cover - trivial
         return f"Vector({self.comps})"
 
@@ -109,47 +176,15 @@ class Vector:
         - Non-finite inputs are handled explicitly:
             if any component is NaN, the result is NaN;
             if any component has infinite magnitude, the result is ``inf``.
-        - Uses a scaling strategy for numerical stability to avoid overflow
+        - Uses :func:`math.hypot`, which scales internally to avoid overflow
             and underflow with mixed-magnitude components.
         """
-        # Fast paths for non-finite inputs without importing math
-        any_inf = False
-        for c in self.comps:
-            # NaN check: NaN != NaN
-            if c != c:
-                return float("nan")
-            if c == float("inf") or c == float("-inf"):
-                any_inf = True
-        if any_inf:
-            return float("inf")
-
-        # Stable accumulation with scaling (Smith's method)
-        scale = 0.0
-        sumsq = 1.0
-        nonzero_seen = False
-
-        for c in self.comps:
-            if c == 0.0:
-                continue
-            nonzero_seen = True
-            abs_c = c if c >= 0.0 else -c
-            if scale < abs_c:
-                if scale == 0.0:
-                    # first non-zero term
-                    scale = abs_c
-                    sumsq = 1.0
-                else:
-                    sumsq = 1.0 + sumsq * (scale / abs_c) ** 2
-                    scale = abs_c
-            else:
-                # here scale >= abs_c and scale > 0.0, safe to divide
-                sumsq += (abs_c / scale) ** 2
-
-        if not nonzero_seen:
-            return 0.0
-
-        # Use built-in power for sqrt without importing math
-        return float(scale * (sumsq**0.5))
+        # math.hypot scales internally and is correctly rounded to within an
+        # ulp; it gives inf precedence over NaN (C99), so restore NaN-first
+        r = _hypot(*self.comps)
+        if r == math.inf and any(c != c for c in self.comps):
+            return math.nan
+        return r
 
     def dot(self, other: "Vector") -> float:
         r"""
@@ -158,46 +193,36 @@ class Vector:
         Formula
         -------
         :math:`\mathbf{v} \cdot \mathbf{w} = \sum_i v_i w_i`.
+
+        Notes
+        -----
+        NaN components give NaN; indeterminate ``0 * inf`` terms contribute 0.
+        The products are summed with :func:`math.fsum`, so the result is the
+        correctly rounded sum of the rounded products, independent of the
+        summation order.
         """
         if not isinstance(other, Vector):
             raise InvalidTypeError("other must be Vector.")
-        _same_dim(self.dimension(), other.dimension())
-        total = 0.0
-        c = 0.0
-        for a, b in zip(self.comps, other.comps):
-            # NaN propagation: if either input is NaN, the dot is NaN
-            if a != a or b != b:  # NaN check
-                return float("nan")
-
-            # Handle indeterminate 0 * inf (or inf * 0) as contributing 0.0
-            if (a == 0.0 and (b == float("inf") or b == float("-inf"))) or (
-                b == 0.0 and (a == float("inf") or a == float("-inf"))
-            ):
-                # mathematically this term is 0; avoid NaN from IEEE 0*inf
-                continue
-
-            prod = a * b
-            # Kahan summation: add with compensation
-            y = prod - c
-            t = total + y
-            c = (t - total) - y
-            total = t
-        return total
+        a, b = self.comps, other.comps
+        _same_dim(len(a), len(b))
+        return _dot(a, b)
 
     # convenience ops
     def __add__(self, other: "Vector") -> "Vector":
         """Component-wise addition."""
         if not isinstance(other, Vector):
             raise InvalidTypeError("other must be Vector.")
-        _same_dim(self.dimension(), other.dimension())
-        return Vector([a + b for a, b in zip(self.comps, other.comps)])
+        a, b = self.comps, other.comps
+        _same_dim(len(a), len(b))
+        return Vector._from_validated(list(map(add, a, b)))
 
     def __sub__(self, other: "Vector") -> "Vector":
         """Component-wise subtraction."""
         if not isinstance(other, Vector):
             raise InvalidTypeError("other must be Vector.")
-        _same_dim(self.dimension(), other.dimension())
-        return Vector([a - b for a, b in zip(self.comps, other.comps)])
+        a, b = self.comps, other.comps
+        _same_dim(len(a), len(b))
+        return Vector._from_validated(list(map(sub, a, b)))
 
     def __mul__(self, k: Number) -> "Vector":
         """Scalar multiplication ``v * k``.
@@ -217,7 +242,7 @@ class Vector:
 
         # Handle NaN scalar: propagate NaNs
         if k != k:  # NaN
-            return Vector([float("nan") for _ in self.comps])
+            return Vector._from_validated([math.nan] * len(self.comps))
 
         # Handle infinite scalars: return a signed normalized vector to
         # avoid generating ±inf components (which later interact with zeros
@@ -226,16 +251,16 @@ class Vector:
             nrm = self.norm()
             if nrm == 0.0:
                 # 0 * inf -> keep zero vector (no direction)
-                return Vector([0.0 for _ in self.comps])
+                return Vector._from_validated([0.0] * len(self.comps))
             sign_k = 1.0 if k > 0.0 else -1.0
             # Avoid forming an infinite scalar; normalize via per-component division
             out = [(a / nrm) for a in self.comps]
             if sign_k < 0.0:
                 out = [-v for v in out]
-            return Vector(out)
+            return Vector._from_validated(out)
 
         # Finite scalar: regular multiply
-        return Vector([k * a for a in self.comps])
+        return Vector._from_validated([k * a for a in self.comps])
 
     __rmul__ = __mul__  # k * v
 
@@ -252,6 +277,8 @@ class Line:
         Direction vector :math:`d` (must be non-zero).
     """
 
+    __slots__ = ("point", "direction")
+
     def __init__(self, point: Point, direction: Vector):
         if not isinstance(point, Point) or not isinstance(direction, Vector):
             raise InvalidTypeError("point must be Point and direction must be Vector.")
@@ -268,8 +295,9 @@ class Line:
         """Return the point :math:`P_0 + t\\,d`."""
         if not isinstance(t, (int, float)):
             raise InvalidTypeError("t must be real.")
-        return Point(
-            [p + float(t) * d for p, d in zip(self.point.coords, self.direction.comps)]
+        t = float(t)
+        return Point._from_validated(
+            [p + t * d for p, d in zip(self.point.coords, self.direction.comps)]
         )
 
     def contains(self, p: Point, tol: float = 1e-12) -> bool:
@@ -280,22 +308,25 @@ class Line:
         component pairs with :math:`|d_i| \\le \\text{tol}` are skipped.
         """
         _same_dim(self.point.dimension(), p.dimension())
-        ratios = []
-        for (pi, p0i), di in zip(
-            zip(p.coords, self.point.coords), self.direction.comps
-        ):
+        # single pass: compare each ratio with the first as soon as it exists
+        first = None
+        for pi, p0i, di in zip(p.coords, self.point.coords, self.direction.comps):
+            delta = pi - p0i
             if abs(di) <= tol:
-                if abs(pi - p0i) > tol:
+                if abs(delta) > tol:
                     return False  # movement along a zero direction -> off-line
                 continue
-            ratios.append((pi - p0i) / di)
-        if not ratios:
-            # direction is almost zero in all components -> treat as aligned if p == P0
+            r = delta / di
+            if first is None:
+                first = r
+            elif not abs(r - first) <= tol:  # written so that NaN is off-line
+                return False
+        if first is None:
+            # direction is almost zero in all components -> aligned if p == P0
             return all(
                 abs(pi - p0i) <= tol for (pi, p0i) in zip(p.coords, self.point.coords)
             )
-        first = ratios[0]
-        return all(abs(r - first) <= tol for r in ratios[1:])
+        return True
 
 
 class Plane:
@@ -308,8 +339,15 @@ class Plane:
         A reference point :math:`P_0` on the plane.
     normal : Vector
         Normal vector :math:`n` (must be non-zero).
+
+    Notes
+    -----
+    :math:`\lVert n\rVert` is computed once at construction, so the normal
+    must not be modified in place afterwards.
     """
 
+    __slots__ = ("point", "normal", "_n_norm")
+
     def __init__(self, point: Point, normal: Vector):
         if not isinstance(point, Point) or not isinstance(normal, Vector):
             raise InvalidTypeError("point must be Point and normal must be Vector.")
@@ -318,6 +356,8 @@ class Plane:
             raise InvalidValueError("normal vector must be non-zero.")
         self.point = point
         self.normal = normal
+        # math.hypot scales internally (no overflow/underflow); computed once
+        self._n_norm = _hypot(*normal.comps)
 
     def __repr__(self) -> str:  # pragma: no cover - trivial
         return f"Plane(point={self.point}, normal={self.normal})"
@@ -327,12 +367,18 @@ class Plane:
         Return signed distance :math:`\frac{n\cdot (p-P_0)}{\lVert n\rVert}`.
         """
         _same_dim(self.point.dimension(), p.dimension())
-        # Use stable hypot for ||n|| to avoid overflow/underflow.
-        n_norm = hypot_n(*self.normal.comps)
-        if n_norm == 0.0:  # guarded at init; defensive
-            raise InvalidValueError("normal vector must be non-zero.")
-        diff = Vector([a - b for a, b in zip(p.coords, self.point.coords)])
-        return self.normal.dot(diff) / n_norm
+        diff = list(map(sub, p.coords, self.point.coords))
+        return _dot(self.normal.comps, diff) / self._n_norm
+
+    def signed_distances(self, points: Iterable[Point]) -> List[float]:
+        """Return :meth:`signed_distance` for each point, as a list."""
+        n, p0, n_norm = self.normal.comps, self.point.coords, self._n_norm
+        out = []
+        for p in points:
+            if len(p.coords) != len(p0):
+                raise InvalidValueError("dimensions must match.")
+            out.append(_dot(n, list(map(sub, p.coords, p0))) / n_norm)
+        return out
 
     def contains(self, p: Point, tol: float = 1e-12) -> bool:
         """Return ``True`` if ``|n·(p-P0)| <= tol * ||n||``."""
@@ -346,7 +392,54 @@ class GeometryUtils:
     def distance(p1: Point, p2: Point) -> float:
         r"""
         Euclidean distance :math:`\sqrt{\sum_i (x_{1i}-x_{2i})^2}`.
+
+        Notes
+        -----
+        As for :meth:`Vector.norm`, a NaN coordinate difference gives NaN even
+        when another difference is infinite.
+        """
+        # math.dist scales like hypot; its own length check replaces _same_dim
+        # on this per-pair hot path
+        try:
+            return _distance(p1.coords, p2.coords)
+        except ValueError:
+            raise InvalidValueError("dimensions must match.") from None
+
+    @staticmethod
+    def distance_sq(p1: Point, p2: Point) -> float:
+        r"""
+        Squared Euclidean distance :math:`\sum_i (x_{1i}-x_{2i})^2`.
+
+        Skips the square root, e.g. for nearest-neighbour comparisons; unlike
+        ``distance(p1, p2) ** 2`` it is exact for small integer coordinates.
         """
         _same_dim(p1.dimension(), p2.dimension())
-        diffs = [a - b for a, b in zip(p1.coords, p2.coords)]
-        return hypot_n(*diffs)
+        d = list(map(sub, p1.coords, p2.coords))
+        return sum(map(mul, d, d), 0.0)
+
+    @staticmethod
+    def distance_batch(ps: Sequence[Point], qs: Sequence[Point]) -> List[List[float]]:
+        r"""
+        Pairwise distances ``out[i][j] = distance(ps[i], qs[j])``.
+
+        Dimensions are checked once for the whole batch, and each pair costs a
+        single :func:`math.dist` call (non-finite input follows
+        :meth:`distance`). Distances are computed directly rather
+        than via :math:`\lVert a\rVert^2 + \lVert b\rVert^2 - 2\,a\cdot b`,
+        which cancels catastrophically for nearby points.
+
+        Raises
+        ------
+        InvalidValueError
+            If the points do not all have the same dimension.
+        """
+        pcs = [p.coords for p in ps]
+        qcs = [q.coords for q in qs]
+        if len({len(c) for c in pcs} | {len(c) for c in qcs}) > 1:
+            raise InvalidValueError("dimensions must match.")
+        out = [[_dist(a, b) for b in qcs] for a in pcs]
+        # NaN-first fix-up, only for the (rare) rows math.dist sent to inf
+        for a, row in zip(pcs, out):
+            if math.inf in row:
+                row[:] = [_distance(a, b) for b in qcs]
+        return out
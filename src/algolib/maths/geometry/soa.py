@@ -0,0 +1,150 @@
+# src/algolib/maths/geometry/soa.py
+r"""
+Structure-of-arrays (SoA) geometry kernels.
+
+A batch of :math:`M` points or vectors in :math:`\mathbb{R}^N` is passed as
+:math:`N` coordinate *columns* of length :math:`M` (``cols[k][i]`` is the
+``k``-th coordinate of item ``i``) instead of :math:`M` separate
+:class:`~algolib.maths.geometry.geometry.Point` / ``Vector`` objects.
+
+Every kernel walks whole columns with :func:`map`, so the per-element work
+runs in C and no per-item objects are created; the Python-level loop only
+runs over the :math:`N` dimensions. Use :func:`to_columns` to convert
+existing points or vectors.
+
+Notes
+-----
+- Results are plain ``list[float]`` with one entry per item.
+- :func:`norms` and :func:`distances` use :func:`math.hypot` per item
+  (overflow/underflow safe); :func:`dots` and
+  :func:`plane_signed_distances` sum the :math:`N` products left to right.
+- Non-finite products follow plain IEEE arithmetic: a ``0 * inf`` term makes
+  the item NaN, whereas :meth:`Vector.dot` and :meth:`Plane.signed_distance`
+  count such terms as 0 (they also sum with :func:`math.fsum`, so finite
+  results can differ in the last bits).
+"""
+
+from __future__ import annotations
+
+import math
+from itertools import repeat
+from operator import add, mul, sub
+from typing import List, Sequence, Union
+
+from algolib.exceptions import InvalidTypeError, InvalidValueError
+from algolib.maths.geometry.geometry import Point, Vector, _ensure_numbers
+
+Number = Union[int, float]
+Columns = Sequence[Sequence[Number]]
+
+_NOT_NUMBERS = "all coordinates/components must be real numbers."
+
+__all__ = [
+    "to_columns",
+    "norms",
+    "dots",
+    "distances",
+    "plane_signed_distances",
+]
+
+
+def _batch_size(*batches: Columns) -> int:
+    """Check that all batches have the same dimension and item count."""
+    n_dim = len(batches[0])
+    if n_dim == 0:
+        raise InvalidValueError("a batch must have at least one column.")
+    m = len(batches[0][0])
+    for cols in batches:
+        if len(cols) != n_dim:
+            raise InvalidValueError("dimensions must match.")
+        for col in cols:
+            if len(col) != m:
+                raise InvalidValueError("all columns must have the same length.")
+    return m
+
+
+def to_columns(items: Sequence[Union[Point, Vector]]) -> List[List[float]]:
+    """
+    Convert points or vectors of one dimension into coordinate columns.
+
+    Raises
+    ------
+    InvalidValueError
+        If ``items`` is empty or the dimensions differ.
+    """
+    rows = [p.coords if isinstance(p, Point) else p.comps for p in items]
+    if not rows:
+        raise InvalidValueError("items must be non-empty.")
+    n_dim = len(rows[0])
+    if any(len(r) != n_dim for r in rows):
+        raise InvalidValueError("dimensions must match.")
+    return [list(col) for col in zip(*rows)]
+
+
+def norms(v: Columns) -> List[float]:
+    r"""Euclidean norms :math:`\lVert v_i \rVert` of a batch of vectors."""
+    _batch_size(v)
+    try:
+        return list(map(math.hypot, *v))
+    except TypeError as e:
+        raise InvalidTypeError(_NOT_NUMBERS) from e
+
+
+def dots(a: Columns, b: Columns) -> List[float]:
+    r"""Dot products :math:`a_i \cdot b_i` of two batches, item by item."""
+    m = _batch_size(a, b)
+    acc: List[float] = [0.0] * m
+    try:
+        for ak, bk in zip(a, b):
+            acc = list(map(add, acc, map(mul, ak, bk)))
+    except TypeError as e:
+        raise InvalidTypeError(_NOT_NUMBERS) from e
+    return acc
+
+
+def distances(p: Columns, q: Columns) -> List[float]:
+    r"""Euclidean distances :math:`\lVert p_i - q_i \rVert`, item by item."""
+    _batch_size(p, q)
+    try:
+        return list(map(math.hypot, *[map(sub, pk, qk) for pk, qk in zip(p, q)]))
+    except TypeError as e:
+        raise InvalidTypeError(_NOT_NUMBERS) from e
+
+
+def plane_signed_distances(
+    normal: Sequence[Number], point: Sequence[Number], x: Columns
+) -> List[float]:
+    r"""
+    Signed distances :math:`n\cdot(x_i - P_0) / \lVert n \rVert` to one plane.
+
+    Parameters
+    ----------
+    normal : Sequence[Number]
+        Plane normal :math:`n` (non-zero).
+    point : Sequence[Number]
+        A point :math:`P_0` on the plane.
+    x : Columns
+        Coordinate columns of the points to measure.
+
+    Raises
+    ------
+    InvalidValueError
+        If the dimensions differ or the normal is zero.
+    """
+    n = _ensure_numbers(normal)
+    p0 = _ensure_numbers(point)
+    m = _batch_size(x)
+    if not (len(n) == len(p0) == len(x)):
+        raise InvalidValueError("dimensions must match.")
+    n_norm = math.hypot(*n)
+    if n_norm == 0.0:
+        raise InvalidValueError("normal vector must be non-zero.")
+    acc: List[float] = [0.0] * m
+    try:
+        for nk, p0k, xk in zip(n, p0, x):
+            diff = map(sub, xk, repeat(p0k))
+            acc = list(map(add, acc, map(mul, diff, repeat(nk))))
+    except TypeError as e:
+        raise InvalidTypeError(_NOT_NUMBERS) from e
+    # divide rather than multiply by 1 / n_norm, which overflows for tiny normals
+    return [d / n_norm for d in acc]
@@ -1,3 +1,3 @@
-from .prime import is_prime
+from .prime import is_prime, is_prime_bulk
 
-__all__ = ["is_prime"]
+__all__ = ["is_prime", "is_prime_bulk"]
@@ -1,12 +1,96 @@
 from __future__ import annotations
 import math
+from math import isqrt as _isqrt
+from typing import Iterable, List
 from algolib.exceptions import InvalidTypeError, InvalidValueError
 
-__all__ = ["is_prime"]
+__all__ = ["is_prime", "is_prime_bulk"]
+
+# Below this bound trial division beats Miller-Rabin's modular powers.
+_TRIAL_DIVISION_MAX = 1 << 18
+
+# Deterministic Miller-Rabin witness sets: every composite n below the bound
+# fails for at least one base (OEIS A014233; below 2**64, Sinclair's seven
+# bases, all smaller than the n they are used for).
+_MR_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+_MR_BASES_U64 = (2, 325, 9375, 28178, 450775, 9780504, 1795265022)
+_MR_WITNESSES = (
+    (3_215_031_751, _MR_PRIMES[:4]),
+    (341_550_071_728_321, _MR_PRIMES[:7]),
+    (1 << 64, _MR_BASES_U64),
+    (318_665_857_834_031_151_167_461, _MR_PRIMES),
+)
+_MR_LIMIT = _MR_WITNESSES[-1][0]
+
+# Sieve of Eratosthenes shared by is_prime_bulk and is_prime: one byte per
+# integer (1 = prime), built lazily, at least _SIEVE_MIN entries, doubled on
+# growth and never larger than _SIEVE_CAP bytes (16 MiB).
+_SIEVE_MIN = 1 << 20
+_SIEVE_CAP = 1 << 24
+_sieve = bytearray()
+
+
+def _miller_rabin(n: int) -> bool:
+    """Deterministic Miller-Rabin for odd ``_TRIAL_DIVISION_MAX <= n < _MR_LIMIT``."""
+    for p in _MR_PRIMES:
+        if n % p == 0:
+            return False
+    for bound, bases in _MR_WITNESSES:
+        if n < bound:
+            break
+    # n - 1 = d * 2**s with d odd
+    n1 = n - 1
+    s = (n1 & -n1).bit_length() - 1
+    d = n1 >> s
+    for a in bases:
+        x = pow(a, d, n)
+        if x == 1 or x == n1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n1:
+                break
+        else:
+            return False
+    return True
+
+
+def _build_sieve(size: int) -> bytearray:
+    """Return the primality table of ``range(size)``; slice stores run in C."""
+    s = bytearray([1]) * size
+    s[:2] = b"\0\0"
+    s[4::2] = bytes(len(range(4, size, 2)))
+    for p in range(3, math.isqrt(size - 1) + 1, 2):
+        if s[p]:
+            s[p * p :: 2 * p] = bytes(len(range(p * p, size, 2 * p)))
+    return s
+
+
+def _sieve_upto(n: int) -> bytearray:
+    """Return the shared sieve, grown to cover ``n`` (within ``_SIEVE_CAP``)."""
+    global _sieve
+    if n >= len(_sieve) and len(_sieve) < _SIEVE_CAP:
+        size = max(n + 1, 2 * len(_sieve), _SIEVE_MIN)
+        _sieve = _build_sieve(min(size, _SIEVE_CAP))
+    return _sieve
+
+
+def _check_n(n: int) -> None:
+    if not isinstance(n, int):
+        raise InvalidTypeError(f"n must be int, got {type(n).__name__}")
+    if n < 0:
+        raise InvalidValueError(f"n must be non-negative, got {n}")
 
 
 def is_prime(n: int) -> bool:
-    r"""Check whether an integer is a prime using the :math:`6k \pm 1` optimization.
+    r"""Check whether an integer is a prime.
+
+    Uses :math:`6k \pm 1` trial division for small ``n`` and a deterministic
+    Miller-Rabin test (fixed bases, at most twelve) for
+    :math:`2^{18} \le n < 3.18 \times 10^{23}`, which covers all 64-bit
+    integers. Larger ``n`` fall back to trial division, whose cost grows as
+    :math:`O(\sqrt{n})`. Once :func:`is_prime_bulk` has built its sieve,
+    ``n`` inside the sieve is answered by lookup.
 
     Parameters
     ----------
@@ -25,20 +109,60 @@ def is_prime(n: int) -> bool:
     InvalidValueError
         If `n` is negative.
     """
-    if not isinstance(n, int):
-        raise InvalidTypeError(f"n must be int, got {type(n).__name__}")
-    if n < 0:
-        raise InvalidValueError(f"n must be non-negative, got {n}")
+    if not isinstance(n, int) or n < 0:
+        _check_n(n)  # raises with the formatted message
+    if n < len(_sieve):
+        return _sieve[n] == 1
     if n < 2:
         return False
     if n < 4:
         return True
     if n % 2 == 0 or n % 3 == 0:
         return False
-    limit = math.isqrt(n)
-    i = 5
-    while i <= limit:
+    if _TRIAL_DIVISION_MAX <= n < _MR_LIMIT:
+        return _miller_rabin(n)
+    # range() steps the candidates in C; the loop body is just the two tests
+    for i in range(5, _isqrt(n) + 1, 6):
         if n % i == 0 or n % (i + 2) == 0:
             return False
-        i += 6
     return True
+
+
+def is_prime_bulk(ns: Iterable[int]) -> List[bool]:
+    r"""Primality of many integers, answered from a shared sieve.
+
+    A Sieve of Eratosthenes covering ``max(ns)`` (at least :math:`2^{20}`,
+    at most :math:`2^{24}` entries) is built on first use and grown by
+    doubling; it is kept for later calls, including :func:`is_prime`.
+    Values beyond the sieve are tested individually with :func:`is_prime`.
+
+    Parameters
+    ----------
+    ns : Iterable[int]
+        Non-negative integers to test.
+
+    Returns
+    -------
+    list[bool]
+        ``[is_prime(n) for n in ns]``.
+
+    Raises
+    ------
+    InvalidTypeError
+        If an element is not int.
+    InvalidValueError
+        If an element is negative.
+
+    Examples
+    --------
+    >>> is_prime_bulk([1, 2, 9, 97])
+    [False, True, False, True]
+    """
+    ns = list(ns)
+    for n in ns:
+        _check_n(n)
+    if not ns:
+        return []
+    sieve = _sieve_upto(max(ns))
+    size = len(sieve)
+    return [sieve[n] == 1 if n < size else is_prime(n) for n in ns]
@@ -4,6 +4,7 @@ from .constants import *
 from .stable import hypot, hypot_n, hypot_iter, gcd
 from .sqrt import newton_sqrt
 from .rounding import round_half_away_from_zero, round_even
+from .trig import sin, cos, tan
 from .hyper import sinh, cosh, tanh
 from .pow import pow
 
@@ -19,6 +20,9 @@ __all__ = [
     "newton_sqrt",
     "round_half_away_from_zero",
     "round_even",
+    "sin",
+    "cos",
+    "tan",
     "sinh",
     "cosh",
     "tanh",
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 import math
+from math import cos as _cos, isfinite as _is_finite, sin as _sin, tan as _tan
 from typing import Protocol, Optional, Dict
 
 
@@ -16,21 +17,34 @@ class TrigBackend(Protocol):
 _NAN = float("nan")
 
 
-def _is_finite(x: float) -> bool:
-    return x == x and x != float("inf") and x != float("-inf")
-
-
 class SystemTrigBackend:
     name = "system"
 
     def sin(self, x: float) -> float:
-        return math.sin(x) if _is_finite(x) else _NAN
+        return _sin(x) if _is_finite(x) else _NAN
 
     def cos(self, x: float) -> float:
-        return math.cos(x) if _is_finite(x) else _NAN
+        return _cos(x) if _is_finite(x) else _NAN
 
     def tan(self, x: float) -> float:
-        # Match tests: non-finite inputs must yield NaN
+        # libm's tan already reduces any finite argument accurately
+        return _tan(x) if _is_finite(x) else _NAN
+
+
+class StrictPeriodicTrigBackend(SystemTrigBackend):
+    """System backend whose ``tan`` reduces modulo the float ``2π`` first.
+
+    ``tan(x)`` is :func:`math.tan` of ``math.remainder(x, 2π)`` folded into
+    :math:`[-π/2, π/2]`, so ``x`` and ``x + 2πk`` share one representative.
+    Select it with ``set_backend("strict")`` when that periodicity matters
+    more than accuracy: for large ``|x|`` the rounded ``2π`` shifts the
+    result away from ``math.tan(x)``, which ``"system"`` returns.
+    """
+
+    name = "strict"
+
+    def tan(self, x: float) -> float:
+        # non-finite inputs must yield NaN
         if not _is_finite(x):
             return _NAN
         # Step 1: align with test reference representative in [-π, π)
@@ -48,17 +62,30 @@ class SystemTrigBackend:
         return math.tan(rc)
 
 
-# 初始只注册 system，pure 延迟加载
+# 初始注册 system 与 strict，pure 延迟加载
 _BACKENDS: Dict[str, TrigBackend] = {
     "system": SystemTrigBackend(),
+    "strict": StrictPeriodicTrigBackend(),
 }
 _CURRENT: TrigBackend = _BACKENDS["system"]
 
+# Bound methods of the active backend, rebound together by _activate so the
+# trig wrappers dispatch with one module-attribute load instead of
+# get_backend() plus a method lookup.
+sin = _CURRENT.sin
+cos = _CURRENT.cos
+tan = _CURRENT.tan
+
+
+def _activate(backend: TrigBackend) -> None:
+    global _CURRENT, sin, cos, tan
+    sin, cos, tan = backend.sin, backend.cos, backend.tan
+    _CURRENT = backend
+
 
 def set_backend(name: str) -> None:
-    global _CURRENT
     if name in _BACKENDS:
-        _CURRENT = _BACKENDS[name]
+        _activate(_BACKENDS[name])
         return
     if name == "pure":
         # 延迟导入，避免未使用时计入覆盖率
@@ -77,7 +104,7 @@ def set_backend(name: str) -> None:
                 return _pure.tan(x) if _is_finite(x) else _NAN
 
         _BACKENDS["pure"] = PureTrigBackend()
-        _CURRENT = _BACKENDS["pure"]
+        _activate(_BACKENDS["pure"])
         return
     raise ValueError(f"unknown numerics backend: {name!r}")
 
@@ -2,12 +2,15 @@
 """
 Centralized numerical constants for algolib.
 
-- No imports from :mod:`math` or third-party libs: pure Python floats only.
+- No third-party imports; pure Python floats only. :mod:`math` is used for
+    a single C primitive (``copysign``), never for the constants themselves.
 - Values are given either as exact decimal, or with comments showing hex-float
     for traceability.
 - Includes Cody-Waite style splits for stable range-reduction in exp/sin/cos.
 """
 
+from math import copysign as _copysign
+
 from algolib.exceptions import NumericOverflowError
 
 # -----------------------------
@@ -107,76 +110,48 @@ ABS_EPS_DEFAULT = 1e-12
 
 
 # ------------------------------------------------
-# Small helpers (no math.*; keep them dependency-free)
+# Small helpers (keep them dependency-free)
 # ------------------------------------------------
+def _build_pow2_table() -> tuple:
+    """2**k for k = -1074..1023, by exact doubling from DBL_DENORM_MIN."""
+    table = []
+    y = DBL_DENORM_MIN
+    for _ in range(1074 + 1024):
+        table.append(y)
+        y *= 2.0  # powers of two: every product is exact
+    return tuple(table)
+
+
+# 2**k lives at POW2_TABLE[k + 1074] for k = -1074..1023 (subnormals included);
+# 2098 exact floats (~16 KiB), built once at import
+POW2_TABLE = _build_pow2_table()
+
+
 def pow2_int(k: int) -> float:
-    """Compute 2**k using only multiplies (supports negative k) with IEEE754-style bounds.
+    """Compute 2**k (supports negative k) with IEEE754-style bounds.
 
     Behavior:
       - k >  1023 -> raise NumericOverflowError (subclass of OverflowError)
       - k < -1074 -> 0.0 (underflow to zero)
-      - -1074 <= k <= -1023 -> exact subnormal via halving from DBL_MIN
-      - otherwise -> exponentiation-by-squaring (<= 1023 以及 >= -1022)
+      - otherwise -> exact 2**k (subnormal for -1074 <= k <= -1023), read
+        from a table precomputed at import (one tuple index per call)
     """
-    if k == 0:
-        return 1.0
     if k > 1023:
         # mirror builtin overflow, 但用库内异常（是 OverflowError 的子类）
         raise NumericOverflowError("Result too large")
     if k < -1074:
         # underflow to zero
         return 0.0
-
-    if k >= DBL_MIN_EXP:  # 正规区间（包含 -1022）
-        if k > 0:
-            y = 1.0
-            base = 2.0
-            n = k
-            while n:
-                if (n & 1) != 0:
-                    y *= base
-                base *= base
-                n >>= 1
-            return y
-        else:
-            # -1022 <= k <= -1：用 0.5 的平方幂，稳定且不会一路掉成 0
-            y = 1.0
-            base = 0.5  # 2**-1
-            n = -k
-            while n:
-                if (n & 1) != 0:
-                    y *= base
-                base *= base
-                n >>= 1
-            return y
-
-    # 次正规：-1074 <= k <= -1023
-    # 思路：从最小正规 DBL_MIN = 2**-1022 开始，做 (-(k+1022)) 次“乘 0.5”。
-    # 这里最多 52 次，能得到精确的 subnormal。
-    steps = -(k + 1022)  # 介于 1..52
-    y = DBL_MIN
-    for _ in range(steps):
-        y *= 0.5
-    # k = -1074 时 y == DBL_DENORM_MIN（5e-324）
-    return y
+    return POW2_TABLE[k + 1074]
 
 
 def copysign1(x: float, y: float) -> float:
-    r"""Return :math:\\abs{x} with the sign of y. No math module, handles ±0.0 and NaN."""
+    r"""Return :math:\abs{x} with the sign of y. Handles ±0.0; NaN ``y`` returns x."""
     # y 是 NaN：按约定返回 x 本身（测试也是这么期望的）
     if y != y:  # NaN 自不等
         return x
-
-    # 取 |x|
-    ax = x if x >= 0.0 else -x
-
-    # y == 0.0 时，用十六进制表示判断符号位
-    if y == 0.0:
-        neg = float.hex(y).startswith("-")
-        return -ax if neg else ax
-
-    # 其余情况：比较即可
-    return ax if y > 0.0 else -ax
+    # C 层直接读符号位（含 ±0.0），不再构造 float.hex 字符串
+    return _copysign(x, y)
 
 
 __all__ = [
@@ -224,6 +199,7 @@ __all__ = [
     "REL_EPS_DEFAULT",
     "ABS_EPS_DEFAULT",
     # small helpers
+    "POW2_TABLE",
     "pow2_int",
     "copysign1",
 ]
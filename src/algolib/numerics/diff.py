@@ -1,6 +1,6 @@
 from __future__ import annotations
 import math
-from typing import Callable
+from typing import Callable, Iterable, List
 
 
 def derivative_cstep(
@@ -33,12 +33,28 @@ def derivative_central(
     scale = max(1.0, abs(x))
     h = 1e-3 * scale if h is None else h
 
-    T = []
+    # Richardson table, one row at a time: row k only needs row k - 1.
+    prev: List[float] = []
     for k in range(max_iter):
         hk = h / (2**k)
-        T0k = (f(x + hk) - f(x - hk)) / (2.0 * hk)
-        T.append([T0k])
+        row = [(f(x + hk) - f(x - hk)) / (2.0 * hk)]
         for j in range(1, k + 1):
-            num = T[k][j - 1] - T[k - 1][j - 1]
-            T[k].append(T[k][j - 1] + num / (4**j - 1))
-    return T[-1][-1]
+            row.append(row[j - 1] + (row[j - 1] - prev[j - 1]) / (4**j - 1))
+        prev = row
+    return prev[-1]
+
+
+def derivative_central_batch(
+    f: Callable[[float], float],
+    xs: Iterable[float],
+    *,
+    h: float | None = None,
+    max_iter: int = 6,
+) -> List[float]:
+    """
+    :func:`derivative_central` at each point of ``xs``, as a list.
+
+    ``h`` (if given) and ``max_iter`` apply to every point; with ``h=None``
+    each point gets its own default step ``1e-3 * max(1, |x|)``.
+    """
+    return [derivative_central(f, x, h=h, max_iter=max_iter) for x in xs]
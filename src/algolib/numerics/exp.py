@@ -3,10 +3,10 @@ from __future__ import annotations
 
 from typing import Final
 from algolib.numerics.constants import (
-    LN2_HI,
-    LN2_LO,
+    INF,
     INV_LN2,
-    DBL_MAX,
+    NAN,
+    POW2_TABLE,
 )
 
 # NOTE: No math import: keep numerics self-contained.
@@ -16,25 +16,40 @@ LOG2_E: Final[float] = INV_LN2
 MAX_LOG: Final[float] = 709.782712893384  # ln(DBL_MAX)
 MIN_LOG: Final[float] = -745.1332191019411  # ln(min subnormal)
 
+# ln(2)/32 split so that k * _LN2_32_HI is exact for |k| < 2**21 (the high
+# part of ln 2 has 21 trailing zero bits, fdlibm); dividing by 32 is exact.
+_LN2_32_HI: Final[float] = 6.93147180369123816490e-01 / 32.0
+_LN2_32_LO: Final[float] = 1.90821492927058770002e-10 / 32.0
+_INV_LN2_32: Final[float] = 32.0 * INV_LN2
+
+# 2**(j/32) for j = 0..31, built once at import
+_EXP2_32: Final[tuple] = tuple(2.0 ** (j / 32.0) for j in range(32))
+
+# 2**-54 rescales results whose power of two is below the normal range
+_TWO_M54: Final[float] = POW2_TABLE[1074 - 54]
+
 
 def exp(x: float) -> float:
     r"""
-    Compute the natural exponential :math:`e^x` using Cody-Waite style range
-    reduction and a Padé [5/5] kernel, without relying on :mod:`math`.
+    Compute the natural exponential :math:`e^x` using table-driven range
+    reduction and a short polynomial kernel, without relying on :mod:`math`.
 
     Algorithm
     ---------
     1. Range reduction:
-        1. Choose integer :math:`k = \text{round}(x / \ln 2)`.
-        2. Let :math:`r = x - k \ln 2` computed via ``LN2_HI`` + ``LN2_LO`` splitting to reduce cancellation.
-        3. Then :math:`\exp{x} = 2^k \cdot \exp{r}`.
-        4. A guard is applied to ensure :math:`k \neq \pm 1024` to avoid overflow in :math:`2^k`.
-    2. Kernel approximation on :math:`r` in :math:`[-\ln2/2, \ln2/2]`:
-        1. Use a [5/5] Padé approximant:
-                \exp(r) \approx \frac{30240 + 15120 r + 3360 r^2 + 420 r^3 + 30 r^4 + r^5}
-                {30240 - 15120 r + 3360 r^2 - 420 r^3 + 30 r^4 - r^5}.
+        1. Choose integer :math:`k = \text{round}(32 x / \ln 2)`.
+        2. Let :math:`r = x - k \ln 2 / 32`, computed with a two-part split of
+           :math:`\ln 2 / 32` whose high part makes :math:`k` times it exact,
+           so :math:`|r| \le \ln 2 / 64`.
+        3. Write :math:`k = 32 q + j` with :math:`0 \le j < 32`. Then
+           :math:`\exp{x} = 2^q \cdot 2^{j/32} \cdot \exp{r}`.
+    2. Kernel approximation on :math:`r` in :math:`[-\ln2/64, \ln2/64]`:
+        1. Use the degree-6 Taylor polynomial (truncation error below
+           :math:`r^7/7! < 4 \times 10^{-18}`):
+                \exp(r) - 1 \approx r + r^2/2 + r^3/6 + r^4/24 + r^5/120 + r^6/720.
 
-    3. Reconstruct with :math:`2^k`.
+    3. Reconstruct as :math:`2^q (T_j + T_j (\exp(r) - 1))` with
+       :math:`T_j = 2^{j/32}` and :math:`2^q` read from precomputed tables.
 
 
     Special cases
@@ -59,57 +74,30 @@ def exp(x: float) -> float:
 
     """
 
-    # Handle specials
-    if x != x:  # NaN
-        return float("nan")
-    if x == float("inf"):
-        return float("inf")
-    if x == float("-inf"):
-        return 0.0
-
-    # Overflow / underflow clamps
-    if x > MAX_LOG:
-        return float("inf")
-    if x < MIN_LOG:
-        return 0.0
-
-    # Range reduction to keep r in [-ln2/2, ln2/2] without ever hitting k=1024
-    # Use truncation first, then correct by at most one ulp of ln2.
-    k = int(x * LOG2_E)  # truncate toward zero
-    r = x - k * LN2_HI
-    r -= k * LN2_LO
-
-    # If r drifted outside the target interval, shift by one ln2
-    half_ln2 = 0.5 * (LN2_HI + LN2_LO)
-    if r > half_ln2:
-        k += 1
-        r -= LN2_HI
-        r -= LN2_LO
-    elif r < -half_ln2:
-        k -= 1
-        r += LN2_HI
-        r += LN2_LO
-
-    # Guard against hitting k == ±1024 which would overflow 2**k.
-    if k >= 1024:
-        k -= 1
-        r += LN2_HI
-        r += LN2_LO
-    elif k <= -1024:
-        k += 1
-        r -= LN2_HI
-        r -= LN2_LO
-
-    # Padé [5/5] kernel (matches series up to r^10)
-    r2 = r * r
-    r3 = r2 * r
-    r4 = r2 * r2
-    r5 = r4 * r
-    # Coefficients follow the standard [5/5] Padé for exp:
-    # num = 30240 + 15120 r + 3360 r^2 + 420 r^3 + 30 r^4 + r^5
-    # den = 30240 - 15120 r + 3360 r^2 - 420 r^3 + 30 r^4 - r^5
-    num = 30240.0 + 15120.0 * r + 3360.0 * r2 + 420.0 * r3 + 30.0 * r4 + r5
-    den = 30240.0 - 15120.0 * r + 3360.0 * r2 - 420.0 * r3 + 30.0 * r4 - r5
-    er = num / den
-
-    return (2.0**k) * er
+    # Specials and overflow / underflow clamps (NaN fails every comparison)
+    if not MIN_LOG <= x <= MAX_LOG:
+        if x != x:
+            return NAN
+        return INF if x > 0.0 else 0.0
+
+    # Range reduction: x = k * ln2/32 + r, |k| <= 34400
+    # (adding 2**20 + 0.5 makes int()'s truncation a round-to-nearest)
+    k = int(x * _INV_LN2_32 + 1048576.5) - 1048576
+    r = (x - k * _LN2_32_HI) - k * _LN2_32_LO
+
+    # Kernel: p = exp(r) - 1 in Horner form
+    p = r + r * r * (
+        0.5
+        + r * (1.0 / 6.0 + r * (1.0 / 24.0 + r * (1.0 / 120.0 + r * (1.0 / 720.0))))
+    )
+    t = _EXP2_32[k & 31]
+    y = t + t * p  # in [2**-(1/64), 2**(1+1/64)]
+
+    # Scale by 2**q (floor division); keep the table index in range and round
+    # subnormal results only once
+    q = k >> 5
+    if q > 1023:
+        return (y * 2.0) * POW2_TABLE[1023 + 1074]
+    if q < -1021:
+        return (y * POW2_TABLE[q + 54 + 1074]) * _TWO_M54
+    return y * POW2_TABLE[q + 1074]
@@ -2,12 +2,74 @@
 
 from __future__ import annotations
 
-from algolib.numerics.exp import exp
+from functools import lru_cache
+from typing import Tuple
+
+from algolib.numerics.constants import INV_LN2
 from algolib.numerics.stable import frexp
-from algolib.numerics.constants import LN2
-from algolib.algorithms.rootfinding import newton
 from algolib.exceptions import InvalidValueError, InvalidTypeError
 
+# ln(2) split so that k * _LN2_HI is exact for |k| < 2**11 (fdlibm e_log.c)
+_LN2_HI = 6.93147180369123816490e-01
+_LN2_LO = 1.90821492927058770002e-10
+_SQRT_HALF = 0.7071067811865476
+
+# Minimax coefficients for (log(1+f) - 2s + s*f) / s, s = f / (2 + f),
+# as a polynomial in s**2 on |s| <= 0.1716 (fdlibm e_log.c; error < 2**-58.45)
+_LG1 = 6.666666666666735130e-01
+_LG2 = 3.999999999940941908e-01
+_LG3 = 2.857142874366239149e-01
+_LG4 = 2.222219843214978396e-01
+_LG5 = 1.818357216161805012e-01
+_LG6 = 1.531383769920937332e-01
+_LG7 = 1.479819860511658591e-01
+
+# log10(2) split like _LN2_HI/_LN2_LO, and 1/ln(10) (fdlibm e_log10.c)
+_LOG10_2HI = 3.01029995663611771306e-01
+_LOG10_2LO = 3.69423907715893078616e-13
+_IVLN10 = 4.34294481903251816668e-01
+
+
+def _log_parts(x: float) -> Tuple[int, float, float, float]:
+    """Reduce a finite ``x > 0`` for the fdlibm kernel.
+
+    Returns ``(e, f, hfsq, sr)`` with ``x = 2**e * (1 + f)``,
+    ``1 + f`` in ``[sqrt(2)/2, sqrt(2))`` and
+    ``log1p(f) = f - (hfsq - sr)``.
+    """
+    # x = m * 2**e with m in [sqrt(2)/2, sqrt(2)), so f = m - 1 is exact
+    m, e = frexp(x)
+    if m < _SQRT_HALF:
+        m *= 2.0
+        e -= 1
+    f = m - 1.0
+
+    # log(1+f) = f - hfsq + s*(hfsq + R(s**2)), s = f / (2 + f)
+    s = f / (2.0 + f)
+    z = s * s
+    w = z * z
+    r = z * (_LG1 + w * (_LG3 + w * (_LG5 + w * _LG7))) + w * (
+        _LG2 + w * (_LG4 + w * _LG6)
+    )
+    hfsq = 0.5 * f * f
+    return e, f, hfsq, s * (hfsq + r)
+
+
+def _checked(x: float) -> float:
+    """Validate a log argument: real, and positive unless NaN."""
+    if not isinstance(x, (int, float)):
+        raise InvalidTypeError(f"log() expects a real number, got {type(x)!r}")
+    x = float(x)
+    if x <= 0.0:
+        raise InvalidValueError("log() domain error: x must be positive")
+    return x
+
+
+@lru_cache(maxsize=16)
+def _ln_base(base: float) -> float:
+    """``ln(base)`` for a validated base; repeated bases hit the cache."""
+    return log(base)
+
 
 def log(x: float, base: float | None = None) -> float:
     r"""
@@ -23,14 +85,17 @@ def log(x: float, base: float | None = None) -> float:
        - ``x == 0.0 -> -inf``
        - ``x < 0`` raises :class:`InvalidValueError`.
 
-    2) **Initial guess via binary scaling**:
+    2) **Binary scaling**:
 
-       Use our own :func:`frexp` to write ``x = m * 2**e`` with ``m in [0.5, 1)``.
-       Then ``ln(x) = ln(m) + e * LN2``. For ``ln(m)`` seed Newton with the short
-       series ``log1p(t) ≈ t - t^2/2 + t^3/3`` where ``t = m - 1``.
+       Use our own :func:`frexp` to write ``x = m * 2**e`` and renormalise so
+       that ``m in [sqrt(2)/2, sqrt(2))``. Then ``ln(x) = e * LN2 + log1p(f)``
+       with ``f = m - 1``, where ``e * LN2`` is formed from a two-part split of
+       ``ln 2`` whose high part makes ``e * LN2_hi`` exact.
 
-    3) **Refine with Newton** on ``f(y) = exp(y) - x`` using our own
-       :func:`exp` as both function and derivative: ``f'(y) = exp(y)``.
+    3) **Minimax kernel** (fdlibm ``e_log.c``): with ``s = f / (2 + f)``,
+       ``log1p(f) = f - f**2/2 + s*(f**2/2 + R(s**2))`` where ``R`` is a
+       degree-7 minimax polynomial on ``|s| <= 0.1716``. No iteration is
+       needed; the result is within 1 ulp.
 
     Parameters
     ----------
@@ -56,8 +121,7 @@ def log(x: float, base: float | None = None) -> float:
     -----
     - Implementation avoids :mod:`math` and relies only on the library's
       internal numerics.
-    - ``frexp`` handles subnormal inputs; the Newton step quickly brings
-      the seed to full precision.
+    - ``frexp`` handles subnormal inputs, so they need no special casing.
     """
     # Type check (accept ints/bools as numbers)
     if not isinstance(x, (int, float)):
@@ -76,31 +140,14 @@ def log(x: float, base: float | None = None) -> float:
         if x == 1.0:
             ln_x = 0.0
         else:
-            # frexp-based seed: x = m * 2**e with m in [0.5, 1)
-            m, e = frexp(x)
-
-            # m is in [0.5, 1), so t in [-0.5, 0)
-            t = m - 1.0
-            # cubic seed for log1p(t)
-            log_m_seed = t - 0.5 * t * t + (t * t * t) / 3.0
-
-            y0 = e * LN2 + log_m_seed
-
-            # Newton refinement: f(y) = exp(y) - x, f'(y) = exp(y)
-            root = newton(
-                lambda y: exp(y) - x,
-                lambda y: exp(y),
-                x0=y0,
-                tol=1e-15,
-                max_iter=50,
-            )
-            ln_x = float(root)
+            e, f, hfsq, sr = _log_parts(x)
+            ln_x = e * _LN2_HI - ((hfsq - (sr + e * _LN2_LO)) - f)
 
     # If base is not specified, return ln(x)
     if base is None:
         return ln_x
 
-    # Validate and compute ln(base) using the same API (recursive, but base branch only)
+    # Validate base; ln(base) is computed once per distinct base and cached
     if not isinstance(base, (int, float)):
         raise InvalidTypeError(f"log() base must be a real number, got {type(base)!r}")
 
@@ -111,27 +158,37 @@ def log(x: float, base: float | None = None) -> float:
     if base_val <= 0.0 or base_val == 1.0:
         raise InvalidValueError("log() base must be positive and not equal to 1")
 
-    ln_base = log(base_val)  # recursive call with base=None path
-
-    return ln_x / ln_base
+    return ln_x / _ln_base(base_val)
 
 
 def log10(x: float) -> float:
     r"""
     Base-10 logarithm of ``x``.
 
-    Equivalent to ``log(x, 10.0)``.
+    Same domain and specials as ``log(x, 10.0)``; evaluated directly as
+    ``e * log10(2) + log1p(f) / ln(10)`` from the same reduction, so exact
+    powers of ten give exact integers.
     """
-    return log(x, 10.0)
+    x = _checked(x)
+    if not x < float("inf"):  # NaN or +inf
+        return x
+    e, f, hfsq, sr = _log_parts(x)
+    return e * _LOG10_2HI + (e * _LOG10_2LO + _IVLN10 * (f - (hfsq - sr)))
 
 
 def log2(x: float) -> float:
     r"""
     Base-2 logarithm of ``x``.
 
-    Equivalent to ``log(x, 2.0)``.
+    Same domain and specials as ``log(x, 2.0)``; evaluated directly as
+    ``e + log1p(f) / ln(2)`` from the same reduction, so powers of two are
+    exact.
     """
-    return log(x, 2.0)
+    x = _checked(x)
+    if not x < float("inf"):  # NaN or +inf
+        return x
+    e, f, hfsq, sr = _log_parts(x)
+    return e + (f - (hfsq - sr)) * INV_LN2
 
 
 if __name__ == "__main__":
@@ -1,6 +1,8 @@
 # src/algolib/numerics/sqrt.py
 from __future__ import annotations
+import math
 from algolib.exceptions import ConvergenceError
+from algolib.numerics.constants import INV_SQRT2
 
 
 def newton_sqrt(x: float, *, tol: float = 1e-15, max_iter: int = 100) -> float:
@@ -10,8 +12,10 @@ def newton_sqrt(x: float, *, tol: float = 1e-15, max_iter: int = 100) -> float:
     Notes
     -----
     Uses the overflow-safe iteration y_{k+1} = 0.5 * (y_k + x / y_k).
-    The initial guess is derived from the binary exponent of `x`
-    (parsed via float.hex) to match the magnitude of sqrt(x).
+    With ``x = m * 2**p`` (via :func:`math.frexp`), the initial guess is a
+    linear fit ``0.41731 + 0.59016 * m`` of sqrt(m) on [0.5, 1), scaled by
+    ``2**(p/2)``. It carries ~8 correct bits, so three or four iterations
+    reach full double precision. Convergence is tested relative to ``y``.
     """
     # Specials
     if x != x:  # NaN
@@ -23,13 +27,14 @@ def newton_sqrt(x: float, *, tol: float = 1e-15, max_iter: int = 100) -> float:
     if x == float("inf"):
         return float("inf")
 
-    # Initial guess from binary exponent: float.hex(x) -> '0x1.23p+e'
-    hx = float.hex(x)
-    try:
-        p = int(hx.split("p")[-1])
-    except Exception:
-        p = 0
-    y = 2.0 ** (p // 2)
+    # Initial guess: x = m * 2**p with m in [0.5, 1), sqrt(m) ~ linear fit
+    m, p = math.frexp(x)
+    y = 0.41731 + 0.59016 * m
+    if p & 1:
+        # odd exponent: sqrt(m * 2**p) = sqrt(m / 2) * 2**((p + 1) / 2)
+        y *= INV_SQRT2
+        p += 1
+    y = math.ldexp(y, p // 2)
     if y == 0.0:
         y = 1.0  # safety for subnormals
 
@@ -37,6 +42,6 @@ def newton_sqrt(x: float, *, tol: float = 1e-15, max_iter: int = 100) -> float:
     for _ in range(max_iter):
         prev = y
         y = 0.5 * (y + x / y)
-        if abs(y - prev) <= tol * max(1.0, y):
+        if abs(y - prev) <= tol * y:
             return y
     return y
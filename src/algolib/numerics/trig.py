@@ -1,6 +1,6 @@
 from __future__ import annotations
 from typing import Any
-from ._backend import get_backend
+from . import _backend
 
 
 def sin(x: Any) -> float:
@@ -17,7 +17,7 @@ def sin(x: Any) -> float:
     float
         ``sin(x)`` evaluated by the active numerics backend.
     """
-    return get_backend().sin(x)
+    return _backend.sin(x)
 
 
 def cos(x: Any) -> float:
@@ -34,7 +34,7 @@ def cos(x: Any) -> float:
     float
         ``cos(x)`` evaluated by the active numerics backend.
     """
-    return get_backend().cos(x)
+    return _backend.cos(x)
 
 
 def tan(x: Any) -> float:
@@ -44,8 +44,9 @@ def tan(x: Any) -> float:
     Notes
     -----
     Argument-reduction and non-finite handling are performed inside the
-    active backend (see ``_backend.SystemTrigBackend.tan``). Keeping this
-    wrapper free of extra reduction ensures consistent periodicity tests.
+    active backend: ``"system"`` calls :func:`math.tan` directly, while
+    ``"strict"`` first reduces modulo ``2π`` (see
+    ``_backend.StrictPeriodicTrigBackend``).
 
     Parameters
     ----------
@@ -57,4 +58,4 @@ def tan(x: Any) -> float:
     float
         ``tan(x)`` evaluated by the active numerics backend.
     """
-    return get_backend().tan(x)
+    return _backend.tan(x)
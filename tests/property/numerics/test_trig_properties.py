@@ -8,6 +8,7 @@ set_backend("system")
 
 from algolib.numerics.trig import sin as my_sin, cos as my_cos, tan as my_tan
 from algolib.numerics import constants as C
+from algolib.numerics._backend import StrictPeriodicTrigBackend
 from hypothesis import given, settings, strategies as st, assume
 
 # -----------------------
@@ -62,10 +63,18 @@ def test_sin_cos_match_math(x: float):
 @settings(max_examples=120)
 @given(x=safe)
 def test_tan_matches_math_away_from_poles(x: float):
+    # system 后端直接调用 math.tan
+    assert my_tan(x) == math.tan(x)
+
+
+@settings(max_examples=120)
+@given(x=safe)
+def test_strict_tan_matches_reduced_math(x: float):
+    strict_tan = StrictPeriodicTrigBackend().tan
     # 与实现保持一致：先规约到 [-π/2, π/2] 再比较
     xr = math.remainder(x, C.TAU)
     assume(_dist_to_half_pi_grid(xr) > 1.2e-4)
-    assert _isclose(my_tan(x), math.tan(xr), rel=1.2e-9, abs_=8e-10, ulps=4096)
+    assert _isclose(strict_tan(x), math.tan(xr), rel=1.2e-9, abs_=8e-10, ulps=4096)
 
 
 # -----------------------
@@ -2,9 +2,9 @@
 import math
 import pytest
 
-from algolib.algorithms.rootfinding import newton
+from algolib.algorithms.rootfinding import newton, newton_poly, make_newton
 from algolib.numerics.sqrt import newton_sqrt
-from algolib.exceptions import ConvergenceError
+from algolib.exceptions import ConvergenceError, InvalidValueError
 
 
 # ---------- newton(): finite-difference branch (fprime=None) ----------
@@ -68,3 +68,92 @@ def test_newton_sqrt_extremes(x):
     exp = math.sqrt(x)
     assert math.isfinite(got) and math.isfinite(exp)
     assert abs(got - exp) <= 1e-12 * max(1.0, exp) + 5e-15
+
+
+# ---------- newton(): f(x) evaluated once per iterate ----------
+def test_newton_exact_initial_root_short_circuits():
+    calls = []
+
+    def f(x):
+        calls.append(x)
+        return x - 2.0
+
+    assert newton(f, None, x0=2.0) == 2.0
+    assert calls == [2.0]
+
+
+def test_newton_reuses_residual_between_iterations():
+    calls = []
+
+    def f(x):
+        calls.append(x)
+        return x * x - 2.0
+
+    root = newton(f, lambda x: 2.0 * x, x0=1.0)
+    assert abs(root - math.sqrt(2.0)) <= 1e-15
+    # one evaluation per distinct iterate, never the same point twice
+    assert len(calls) == len(set(calls))
+
+
+# ---------- make_newton(): bound solver for a fixed equation ----------
+@pytest.mark.parametrize("x0", [0.5, 1.0, 3.0])
+def test_make_newton_matches_newton(x0):
+    f = lambda x: x**3 - 2.0  # noqa: E731
+    fp = lambda x: 3.0 * x * x  # noqa: E731
+    solve = make_newton(f, fp, tol=1e-14)
+    assert solve(x0) == newton(f, fp, x0, tol=1e-14)
+
+
+# ---------- newton_sqrt(): relative accuracy across the exponent range ----------
+@pytest.mark.parametrize("x", [5e-324, 1e-310, 1e-300, 0.5, 0.75, 2.0, 3.0, 1e300])
+def test_newton_sqrt_relative_accuracy(x):
+    exp = math.sqrt(x)
+    assert abs(newton_sqrt(x) - exp) <= 4.5e-16 * exp
+
+
+# ---------- newton_poly(): fused Horner evaluation of p and p' ----------
+def test_newton_poly_matches_generic_newton():
+    coeffs = [-2.0, 0.0, 1.0]  # x^2 - 2 (ascending order)
+    root = newton_poly(coeffs, 1.0)
+    assert abs(root - math.sqrt(2.0)) <= 1e-15
+    assert root == newton(lambda x: x * x - 2.0, lambda x: 2.0 * x, 1.0)
+
+
+def test_newton_poly_cubic_and_exact_root():
+    # (x - 1)(x - 2)(x + 3) = x^3 - 7x + 6
+    coeffs = [6.0, -7.0, 0.0, 1.0]
+    assert abs(newton_poly(coeffs, 2.4) - 2.0) <= 1e-14
+    assert newton_poly(coeffs, 1.0) == 1.0
+
+
+def test_newton_poly_errors():
+    with pytest.raises(ValueError):
+        newton_poly([], 0.0)
+    with pytest.raises(ConvergenceError):
+        newton_poly([1.0, 0.0, 1.0], 0.0)  # x^2 + 1: p'(0) == 0
+    with pytest.raises(ConvergenceError):
+        newton_poly([1.0, 0.0, 1.0], 0.5, max_iter=3)  # no real root
+
+
+# ---------- newton(): central-difference derivative ----------
+def test_newton_central_difference():
+    f = lambda x: math.exp(x) - 2.0  # noqa: E731
+    root = newton(f, None, x0=1.0, fd_order=2, fd_eps=1e-6)
+    assert abs(root - math.log(2.0)) <= 1e-14
+
+
+def test_newton_rejects_bad_fd_order():
+    with pytest.raises(InvalidValueError):
+        newton(lambda x: x, None, x0=1.0, fd_order=3)
+
+
+# ---------- newton(): absolute residual tolerance ----------
+def test_newton_ftol_accepts_warm_start():
+    calls = []
+
+    def f(x):
+        calls.append(x)
+        return x - 2.0
+
+    assert newton(f, None, x0=2.0 + 1e-12, ftol=1e-9) == 2.0 + 1e-12
+    assert len(calls) == 1
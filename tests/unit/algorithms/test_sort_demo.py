@@ -49,3 +49,16 @@ def test_insertion_sort_does_not_mutate_input():
     copy = list(data)
     _ = insertion_sort(data)
     assert data == copy
+
+
+@pytest.mark.parametrize("sort", [bubble_sort, insertion_sort])
+def test_large_input_fast_path_matches_reference(sort):
+    from algolib.algorithms.sort_demo import (
+        _bubble_sort_reference,
+        _insertion_sort_reference,
+    )
+
+    data = [(i * 7919) % 101 - 50 for i in range(100)]
+    assert sort(data) == sorted(data)
+    assert _bubble_sort_reference(data) == sorted(data)
+    assert _insertion_sort_reference(data) == sorted(data)
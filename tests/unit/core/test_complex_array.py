@@ -0,0 +1,77 @@
+# tests/unit/core/test_complex_array.py
+import math
+import pytest
+
+from algolib.core import Complex, ComplexArray
+from algolib.exceptions import InvalidTypeError, InvalidValueError
+
+ZS = [Complex(1, 2), Complex(-3.5, 0.25), Complex(0, -1), Complex(1e200, -1e-200)]
+WS = [Complex(3, 4), Complex(2, -7), Complex(-1, 1), Complex(1e-200, 1e200)]
+
+
+def _pack(zs):
+    return ComplexArray.from_complexes(zs)
+
+
+def test_construct_and_roundtrip():
+    za = ComplexArray([1, 2.5], [0, -1])
+    assert len(za) == 2
+    assert za[1] == Complex(2.5, -1)
+    assert za.to_list() == [Complex(1, 0), Complex(2.5, -1)]
+    assert _pack(ZS).to_list() == ZS
+
+
+@pytest.mark.parametrize(
+    "re,im,exc",
+    [
+        ([1, 2], [1], InvalidValueError),
+        (["1"], [0], InvalidTypeError),
+        ([1], [None], InvalidTypeError),
+    ],
+)
+def test_construct_errors(re, im, exc):
+    with pytest.raises(exc):
+        ComplexArray(re, im)
+
+
+def test_from_complexes_rejects_non_complex():
+    with pytest.raises(InvalidTypeError):
+        ComplexArray.from_complexes([Complex(1, 1), (1, 1)])
+
+
+@pytest.mark.parametrize(
+    "op", [lambda x, y: x + y, lambda x, y: x - y, lambda x, y: x * y, lambda x, y: x / y]
+)
+def test_elementwise_ops_match_scalar_complex(op):
+    got = op(_pack(ZS), _pack(WS)).to_list()
+    assert got == [op(z, w) for z, w in zip(ZS, WS)]
+
+
+def test_ops_check_operands():
+    za = _pack(ZS)
+    with pytest.raises(InvalidTypeError):
+        za + ZS  # type: ignore[operator]
+    with pytest.raises(InvalidValueError):
+        za * _pack(WS[:2])
+    with pytest.raises(InvalidValueError):
+        za / ComplexArray([1, 0, 1, 1], [0, 0, 0, 0])
+
+
+def test_modulus_and_from_polar():
+    za = ComplexArray([3, 0, -5], [4, 0, 12])
+    assert za.modulus() == [5.0, 0.0, 13.0]
+
+    r, theta = [2.0, 1.0], [math.pi / 2, 0.3]
+    zp = ComplexArray.from_polar(r, theta)
+    assert zp.to_list() == [Complex.from_polar(rk, tk) for rk, tk in zip(r, theta)]
+    with pytest.raises(InvalidValueError):
+        ComplexArray.from_polar([-1.0], [0.0])
+    with pytest.raises(InvalidValueError):
+        ComplexArray.from_polar([1.0], [0.0, 1.0])
+
+
+def test_unary_ops_and_argument_match_scalar_complex():
+    za = _pack(ZS)
+    assert (-za).to_list() == [-z for z in ZS]
+    assert za.conjugate().to_list() == [z.conjugate() for z in ZS]
+    assert za.argument() == [z.argument() for z in ZS]
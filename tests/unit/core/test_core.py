@@ -1,5 +1,6 @@
 # tests/maths/complex/test_core.py
 import math
+import random
 import pytest
 
 from algolib.core.complex import Complex
@@ -220,3 +221,75 @@ def test_div_branch_d_dominant():
     ref = complex(1.0, 2.0) / complex(0.1, 3.0)
     assert almost(got.re, ref.real)
     assert almost(got.im, ref.imag)
+
+
+def test_complex_has_no_instance_dict():
+    z = Complex(1, 2)
+    assert not hasattr(z, "__dict__")
+    with pytest.raises(AttributeError):
+        z.re = 3.0  # type: ignore[misc]
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 7, 16, 31])
+def test_pow_matches_repeated_multiplication(n):
+    z = Complex(0.9, -0.4)
+    expected = Complex(1, 0)
+    for _ in range(n):
+        expected = expected * z
+    got = z**n
+    assert math.isclose(got.re, expected.re, rel_tol=1e-13, abs_tol=1e-15)
+    assert math.isclose(got.im, expected.im, rel_tol=1e-13, abs_tol=1e-15)
+
+
+def test_operator_results_match_validated_constructor():
+    z, w = Complex(3, -4), Complex(0.5, 2)
+    for got in (z + w, z - w, z * w, z / w, -z, z.conjugate(), z.normalized()):
+        assert type(got) is Complex
+        assert type(got.re) is float and type(got.im) is float
+        assert got == Complex(got.re, got.im)
+        with pytest.raises(AttributeError):
+            got.im = 0.0  # type: ignore[misc]
+
+
+def test_div_subnormal_divisor_keeps_exact_zero_part():
+    # The scaled denominator is subnormal here; 1/denom overflows, so the
+    # quotient must be formed by division (0/denom), never 0 * (1/denom).
+    got = Complex(1.0, -1.0) / Complex(1e-310, 1e-310)
+    assert got.re == 0.0
+    assert got.im == -math.inf
+
+
+@pytest.mark.skipif(not hasattr(math, "fma"), reason="math.fma needs Python 3.13+")
+def test_mul_is_commutative_and_conjugate_product_is_real():
+    x = 1.0 + 2.0**-30
+    z = Complex(x, x) * Complex(x, -x)
+    assert z.re == 2.0 * (x * x)
+    assert z.im == 0.0
+    rng = random.Random(7)
+    for _ in range(500):
+        p = Complex(rng.uniform(-9, 9), rng.uniform(-9, 9))
+        q = Complex(rng.uniform(-9, 9), rng.uniform(-9, 9))
+        assert p * q == q * p
+        assert (p * p.conjugate()).im == 0.0
+
+
+@pytest.mark.parametrize(
+    "z", [Complex(3, 4), Complex(1e308, -1e308), Complex(5e-324, 1e-320), Complex(-2e-310, 0)]
+)
+def test_normalized_unit_modulus_normal_and_subnormal(z):
+    zn = z.normalized()
+    assert abs(abs(zn) - 1.0) <= 4 * 2.0**-52
+    assert math.isclose(zn.argument(), z.argument(), rel_tol=1e-15)
+
+
+def test_from_polar_int_inputs_give_float_parts():
+    z = Complex.from_polar(2, 0)
+    assert type(z.re) is float and type(z.im) is float
+    assert z == Complex(2.0, 0.0)
+
+
+def test_complex_builtin_conversion_roundtrip():
+    z = Complex(3, -4)
+    w = complex(z)
+    assert type(w) is complex and w == 3 - 4j
+    assert Complex(w.real, w.imag) == z
@@ -2,7 +2,13 @@ import math
 import random
 import pytest
 
-from algolib.maths.algebra.lu import lu_factor, lu_solve, lu_det
+from algolib.maths.algebra.lu import (
+    lu_factor,
+    lu_solve,
+    lu_det,
+    lu_slogdet,
+    _permute_inplace_rhs,
+)
 
 
 def _matmul(A, x):
@@ -44,3 +50,75 @@ def test_lu_singular_raises():
     A = [[1.0, 2.0], [2.0, 4.0]]  # rank-1
     with pytest.raises(ValueError):
         lu_factor(A, piv_tol=0.0)
+
+
+def test_lu_factor_upper_triangular_is_unchanged():
+    A = [[2.0, 1.0, -1.0], [0.0, 3.0, 0.5], [0.0, 0.0, 4.0]]
+    LU, piv, sign = lu_factor(A)
+    assert LU == A and piv == [0, 1, 2] and sign == 1
+    assert lu_det(LU, sign) == 24.0
+
+
+def test_lu_multiple_rhs_matches_column_solves():
+    rng = random.Random(7)
+    n, nrhs = 6, 3
+    A = [[rng.uniform(-1.0, 1.0) for _ in range(n)] for _ in range(n)]
+    B = [[rng.uniform(-1.0, 1.0) for _ in range(nrhs)] for _ in range(n)]
+    LU, piv, sign = lu_factor(A)
+    X = lu_solve(LU, piv, B)
+    for col in range(nrhs):
+        x = lu_solve(LU, piv, [B[i][col] for i in range(n)])
+        assert [X[i][col] for i in range(n)] == x
+    assert B[0] is not X[0]
+
+
+def test_permute_inplace_rhs_vector_and_rows():
+    v = [10.0, 11.0, 12.0]
+    _permute_inplace_rhs(v, [2, 0, 1])
+    assert v == [12.0, 10.0, 11.0]
+    rows = [[0.0], [1.0], [2.0]]
+    originals = list(rows)
+    _permute_inplace_rhs(rows, [1, 2, 0])
+    assert rows == [[1.0], [2.0], [0.0]]
+    assert {id(r) for r in rows} == {id(r) for r in originals}
+
+
+def test_lu_det_avoids_intermediate_overflow():
+    A = [[1e200, 0.0, 0.0], [0.0, 1e200, 0.0], [0.0, 0.0, 1e-300]]
+    LU, piv, sign = lu_factor(A)
+    assert lu_det(LU, sign) == pytest.approx(1e100, rel=1e-15)
+    assert lu_det([[1e200, 0.0], [0.0, -1e200]], 1) == -math.inf
+
+
+def test_lu_slogdet_out_of_range_and_singular():
+    n = 50
+    A = [[(1e-10 if i == j else 0.0) for j in range(n)] for i in range(n)]
+    A[0], A[1] = A[1], A[0]  # odd permutation -> negative determinant
+    LU, piv, sign = lu_factor(A)
+    assert lu_det(LU, sign) == 0.0  # -1e-500 underflows
+    s, logabs = lu_slogdet(LU, sign)
+    assert s == -1.0
+    assert logabs == pytest.approx(-500 * math.log(10.0), rel=1e-14)
+    assert lu_slogdet([[0.0]], 1) == (0.0, -math.inf)
+
+
+@pytest.mark.parametrize("tiny", [5e-324, 1e-310, -2.5e-320])
+def test_lu_det_keeps_subnormal_pivots(tiny):
+    LU = [[1.0, 0.0], [0.0, tiny]]
+    assert lu_det(LU, 1) == tiny
+    assert lu_det(LU, -1) == -tiny
+    s, logabs = lu_slogdet(LU, 1)
+    assert s == math.copysign(1.0, tiny)
+    assert logabs == pytest.approx(math.log(abs(tiny)), rel=1e-12)
+
+
+def test_lu_det_mixed_extreme_diagonal():
+    LU = [[1e300, 0.0, 0.0], [0.0, 1e-300, 0.0], [0.0, 0.0, 5e-324]]
+    assert lu_det(LU, 1) == pytest.approx(5e-324)
+    LU = [[1e-300, 0.0, 0.0], [0.0, 3.0, 0.0], [0.0, 0.0, 1e300]]
+    assert lu_det(LU, 1) == pytest.approx(3.0, rel=1e-15)
+    s, logabs = lu_slogdet([[1e300, 0.0], [0.0, 1e300]], 1)
+    assert (s, logabs) == (1.0, pytest.approx(600 * math.log(10.0), rel=1e-14))
+    s, logabs = lu_slogdet([[1e-300, 0.0], [0.0, 5e-324]], -1)
+    assert s == -1.0
+    assert logabs == pytest.approx(math.log(1e-300) + math.log(5e-324), rel=1e-14)
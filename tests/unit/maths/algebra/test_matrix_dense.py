@@ -84,3 +84,163 @@ def test_compare_equals_tolerance():
     B = MatrixDense([[1.0, 2.0 + 1e-13], [3.0, 4.0]])
     assert A.equals(B)  # within default tol
     assert not A.equals(B, tol=1e-15)
+
+
+def test_matmul_and_matvec_match_triple_loop_exactly():
+    import random
+
+    rng = random.Random(3)
+    A = [[rng.uniform(-1, 1) for _ in range(4)] for _ in range(3)]
+    B = [[rng.uniform(-1, 1) for _ in range(5)] for _ in range(4)]
+    ref = []
+    for i in range(3):
+        row = []
+        for j in range(5):
+            s = 0.0
+            for k in range(4):
+                s += A[i][k] * B[k][j]
+            row.append(s)
+        ref.append(tuple(row))
+    assert (MatrixDense(A) * MatrixDense(B)).rows == tuple(ref)
+    v = [1, 2, 3, 4]
+    got = MatrixDense([[1, 0, 0, 0], [0, 0, 0, 2]]).matvec(v)
+    assert got == [1.0, 8.0] and all(type(x) is float for x in got)
+
+
+@pytest.mark.parametrize("inner", [1, 8, 9, 20])
+def test_matmul_kernels_agree_across_dispatch_threshold(inner):
+    import random
+
+    from algolib.maths.algebra.matrix_dense import _matmul_dot, _matmul_ikj
+
+    rng = random.Random(inner)
+    A = [[rng.uniform(-1, 1) for _ in range(inner)] for _ in range(3)]
+    B = [[rng.uniform(-1, 1) for _ in range(4)] for _ in range(inner)]
+    # ikj sums left to right; sum() in _matmul_dot is compensated on 3.12+,
+    # so the kernels agree to within the summation error bound, not bitwise
+    bound = [
+        [inner * 2.0**-52 * sum(abs(a * b[j]) for a, b in zip(r, B)) for j in range(4)]
+        for r in A
+    ]
+    got = [list(r) for r in (MatrixDense(A) * MatrixDense(B)).rows]
+    for out in (_matmul_ikj(A, B), got):
+        for row, ref, tol in zip(out, _matmul_dot(A, B), bound):
+            assert all(abs(x - y) <= t for x, y, t in zip(row, ref, tol))
+
+
+def test_det_inv_pivoting_and_singular():
+    A = MatrixDense([[0, 2, 1], [1, 0, 0], [3, 1, 1]])  # needs row swaps
+    assert A.det() == pytest.approx(-1.0, abs=1e-14)
+    assert (A * A.inv()).equals(MatrixDense.identity(3), tol=1e-12)
+    assert MatrixDense([[1, 2, 3], [2, 4, 6], [0, 1, 1]]).det() == 0.0
+
+
+def test_operation_results_have_tuple_rows():
+    A = MatrixDense([[1, 2], [3, 4]])
+    for M in (A + A, A - A, 2 * A, A * A, A.T(), A.inv(), A.copy()):
+        assert type(M.rows) is tuple
+        assert all(type(r) is tuple and len(r) == 2 for r in M.rows)
+    assert A.T() == MatrixDense([[1, 3], [2, 4]])
+    assert A + A == MatrixDense([[2, 4], [6, 8]])
+
+
+def test_transpose_det_inv_are_memoized():
+    A = MatrixDense([[4, 7], [2, 6]])
+    assert A.T() is A.T() and A.T().T() is A
+    assert A.inv() is A.inv()
+    assert A.det() == A.det() == pytest.approx(10.0)
+    assert A == MatrixDense([[4, 7], [2, 6]])
+    singular = MatrixDense([[1, 2], [2, 4]])
+    assert singular.det() == 0.0
+    for _ in range(2):
+        with pytest.raises(InvalidValueError):
+            singular.inv()
+
+
+def test_constructor_accepts_number_subclasses_and_rejects_others():
+    class F(float):
+        pass
+
+    M = MatrixDense([[True, F(2.5)], [3, 4.0]])
+    assert M.rows == ((1, 2.5), (3, 4.0))
+    with pytest.raises(InvalidTypeError):
+        MatrixDense([[1.0, "2"]])
+    with pytest.raises(InvalidTypeError):
+        MatrixDense([[1.0, 2.0], [3.0, 1j]])
+
+
+def test_det_triangular_shortcut_matches_elimination():
+    U = MatrixDense([[2, 5, -1], [0, 3, 4], [0, 0, -0.5]])
+    L = U.T()
+    assert U.det() == -3.0 and L.det() == -3.0
+    assert MatrixDense([[2, 0], [7, 0]]).det() == 0.0
+    assert MatrixDense([[1e-20, 1], [0, 1]]).det() == 0.0  # same cut-off as LU
+    full = MatrixDense([[2, 5, -1], [1e-300, 3, 4], [0, 0, -0.5]])
+    assert full.det() == pytest.approx(-3.0)
+    U4 = MatrixDense([[2, 5, -1, 1], [0, 3, 4, 1], [0, 0, -0.5, 1], [0, 0, 0, 2]])
+    assert U4.det() == -6.0 and U4.T().det() == -6.0
+    rank3 = [[1, 1, 1, 1], [0, 0, 1, 1], [0, 0, 1, 1], [0, 0, 0, 1]]
+    assert MatrixDense(rank3).det() == 0.0
+
+
+@pytest.mark.parametrize("n", [2, 3])
+def test_small_closed_forms_match_lu(n):
+    import random
+
+    from algolib.maths.algebra.lu import lu_det, lu_factor
+    from algolib.maths.algebra.matrix_dense import _det_small, _matmul_ikj
+
+    def lu_reference(rows):
+        try:
+            LU, _, sign = lu_factor(rows, piv_tol=1e-15)
+        except ValueError:
+            return 0.0
+        return lu_det(LU, sign)
+
+    rng = random.Random(n)
+    cases = [
+        [[rng.uniform(-2, 2) for _ in range(n)] for _ in range(n)] for _ in range(200)
+    ]
+    # rank-deficient and tiny-pivot cases exercise the singular cut-off
+    cases += [[[1, 2, 3][:n]] * n, [[0.0] * n] * n]
+    cases.append(
+        [[1e-16 if i == j == 0 else float(i == j) for j in range(n)] for i in range(n)]
+    )
+    cases.append([[float(i + j) for j in range(n)] for i in range(n)])
+    cases.append([[0, 2, 1][:n], [1, 0, 0][:n], [3, 1, 1][:n]][:n])
+    cases.append([[1, 0, 0][:n], [5, 1e-17, 0][:n], [4, 0, 1][:n]][:n])
+    for rows in cases:
+        ref = lu_reference(rows)
+        got = _det_small(rows)
+        assert (got == 0.0) == (ref == 0.0)
+        assert got == pytest.approx(ref, rel=1e-12, abs=1e-14)
+        A = MatrixDense(rows)
+        if got != 0.0 and abs(got) > 1e-3:
+            assert (A * A.inv()).equals(MatrixDense.identity(n), tol=1e-9)
+        got_mul = [x for r in (A * A).rows for x in r]
+        ref_mul = [x for r in _matmul_ikj(rows, rows) for x in r]
+        assert got_mul == pytest.approx(ref_mul, rel=1e-12, abs=1e-12)
+
+
+def test_repeated_shapes_switch_to_unrolled_kernel(monkeypatch):
+    import random
+
+    from algolib.maths.algebra import matrix_dense as md
+
+    monkeypatch.setattr(md, "_unrolled_kernels", {})
+    monkeypatch.setattr(md, "_shape_hits", {})
+    monkeypatch.setattr(md, "_UNROLL_AFTER", 3)
+    rng = random.Random(0)
+    for m, k, n in [(1, 1, 1), (4, 4, 4), (2, 9, 3), (5, 1, 2)]:
+        A = MatrixDense([[rng.randint(-9, 9) for _ in range(k)] for _ in range(m)])
+        B = MatrixDense([[rng.uniform(-1, 1) for _ in range(n)] for _ in range(k)])
+        generic = (A * B).rows
+        assert (m, k, n) not in md._unrolled_kernels
+        for _ in range(3):
+            assert (A * B).rows == generic  # bit-identical summation order
+        assert (m, k, n) in md._unrolled_kernels
+        assert all(type(x) is float for r in (A * B).rows for x in r)
+    big = MatrixDense.identity(11)
+    for _ in range(4):
+        big * big
+    assert (11, 11, 11) not in md._unrolled_kernels
@@ -47,3 +47,37 @@ def test_derivative_integral_roundtrip():
     assert dp.coeffs == (0.0, 6.0)
     ip = dp.integral(c0=5)  # ∫(6x)dx = 3x^2 + C
     assert ip.coeffs == (5.0, 0.0, 3.0)
+
+
+def test_operation_results_are_canonical():
+    p = Polynomial([1, 2, 3])
+    q = Polynomial([0.5, 0, -3])
+    assert (p + q).coeffs == (1.5, 2.0)  # cancelled x^2 term stripped
+    assert (p - p).coeffs == (0.0,)
+    assert (p * Polynomial([0])).coeffs == (0.0,)
+    assert p + q == Polynomial([1.5, 2.0])
+
+
+def test_eval_matches_exact_rational_horner():
+    import random
+    from fractions import Fraction
+
+    rng = random.Random(5)
+    for _ in range(50):
+        cs = [rng.uniform(0.0, 1.0) for _ in range(rng.randint(1, 25))]
+        x = rng.uniform(0.0, 1.0)
+        exact = Fraction(0)
+        for c in reversed(cs):
+            exact = exact * Fraction(x) + Fraction(c)
+        # positive terms: Horner's error is bounded by ~2n ulps
+        tol = 4 * len(cs) * 2**-52
+        assert Polynomial(cs)(x) == pytest.approx(float(exact), rel=tol)
+
+
+def test_derivative_is_memoized_and_invisible_to_equality():
+    p = Polynomial([1, 2, 3])
+    d = p.derivative()
+    assert p.derivative() is d
+    assert d.coeffs == (2.0, 6.0)
+    assert p == Polynomial([1, 2, 3]) and hash(p) == hash(Polynomial([1, 2, 3]))
+    assert repr(p) == "Polynomial(coeffs=(1.0, 2.0, 3.0))"
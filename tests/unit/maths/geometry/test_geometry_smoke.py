@@ -10,3 +10,112 @@ def test_point_vector_basic():
     assert p.dimension() == 3
     assert math.isclose(v.norm(), 3.0)
     assert math.isclose(GeometryUtils.distance(p, q), 3.0)
+
+
+def test_vector_non_finite_semantics():
+    inf, nan = math.inf, math.nan
+    assert Vector([1e200, 1e200]).dot(Vector([1e100, -1e100])) == 0.0
+    assert Vector([1e308, 1e308]).dot(Vector([1.5, 1.5])) == inf  # overflow
+    assert Vector([0.0, 2.0]).dot(Vector([inf, 3.0])) == 6.0  # 0 * inf -> 0
+    assert math.isnan(Vector([nan, 1.0]).dot(Vector([1.0, 1.0])))
+    assert Vector([0.1] * 10).dot(Vector([1.0] * 10)) == 1.0  # exact sum
+    assert math.isnan(Vector([inf, nan]).norm())
+    assert Vector([-inf, 1.0]).norm() == inf
+    assert Vector([3e-320, 4e-320]).norm() == 5e-320
+    assert Vector([3e300, 4e300]).norm() == 5e300
+
+
+def test_vector_ops_return_float_components():
+    v = Vector([1, 2, 3]) + Vector([1, 1, 1])
+    w = 2 * (Vector([1, 2, 3]) - Vector([1, 1, 1]))
+    assert v.comps == [2.0, 3.0, 4.0] and w.comps == [0.0, 2.0, 4.0]
+    assert all(type(c) is float for c in v.comps + w.comps)
+    assert math.isnan(GeometryUtils.distance(Point([math.nan]), Point([0])))
+    assert GeometryUtils.distance(Point([1e300, 0]), Point([-1e300, 0])) == 2e300
+
+
+def test_distance_batch_matches_pairwise_distance():
+    import pytest
+
+    from algolib.exceptions import InvalidValueError
+
+    ps = [Point([0, 0]), Point([3, 4]), Point([1e-8, 1])]
+    qs = [Point([0, 0]), Point([1e-8, 1 + 1e-9])]
+    got = GeometryUtils.distance_batch(ps, qs)
+    assert got == [[GeometryUtils.distance(p, q) for q in qs] for p in ps]
+    assert got[1][0] == 5.0 and got[2][1] == pytest.approx(1e-9, rel=1e-6)
+    assert GeometryUtils.distance_batch([], qs) == []
+    with pytest.raises(InvalidValueError):
+        GeometryUtils.distance_batch(ps, [Point([1, 2, 3])])
+
+
+def test_distance_rejects_dimension_mismatch():
+    import pytest
+
+    from algolib.exceptions import InvalidValueError
+
+    with pytest.raises(InvalidValueError, match="dimensions must match"):
+        GeometryUtils.distance(Point([0, 0]), Point([1, 2, 3]))
+
+
+def test_line_contains_single_pass():
+    from algolib.maths.geometry.geometry import Line
+
+    line = Line(Point([1, 2, 3]), Vector([1, 0, 2]))
+    assert line.contains(line.point_at(2.5))
+    assert not line.contains(Point([2, 2, 6]))  # ratios 1 and 1.5 disagree
+    assert not line.contains(Point([2, 2.5, 5]))  # moves along d_y = 0
+    assert not line.contains(Point([2, 2, math.nan]))
+    flat = Line(Point([0, 0]), Vector([0.5, 0.0]))
+    assert flat.contains(Point([0.3, 0.1]), tol=0.6)
+    assert not flat.contains(Point([math.nan, 0.1]), tol=0.6)
+
+
+def test_plane_signed_distances():
+    import pytest
+
+    from algolib.exceptions import InvalidValueError
+    from algolib.maths.geometry.geometry import Plane
+
+    plane = Plane(Point([0, 0, 1]), Vector([0, 3, 4]))
+    pts = [Point([5, 0, 1]), Point([0, 3, 5]), Point([1, -3, -3])]
+    assert plane.signed_distances(pts) == [0.0, 5.0, -5.0]
+    assert [plane.signed_distance(p) for p in pts] == [0.0, 5.0, -5.0]
+    assert plane.contains(pts[0]) and not plane.contains(pts[1])
+    huge = Plane(Point([0, 0]), Vector([3e300, 4e300]))
+    assert huge.signed_distance(Point([3, 4])) == pytest.approx(5.0)
+    with pytest.raises(InvalidValueError):
+        plane.signed_distances([Point([1, 2])])
+
+
+def test_geometry_objects_are_slotted():
+    from algolib.maths.geometry.geometry import Line, Plane
+
+    p, v = Point([1, 2]), Vector([0, 1])
+    for obj in (p, v, Line(p, v), Plane(p, v), v + v, 2 * v):
+        assert not hasattr(obj, "__dict__")
+
+
+def test_distance_sq():
+    import pytest
+
+    from algolib.exceptions import InvalidValueError
+
+    p, q = Point([0, 0, 0]), Point([1, 1, 2])
+    assert GeometryUtils.distance_sq(p, q) == 6.0
+    assert GeometryUtils.distance(p, q) ** 2 != 6.0  # the sqrt round trip
+    assert GeometryUtils.distance_sq(q, q) == 0.0
+    with pytest.raises(InvalidValueError):
+        GeometryUtils.distance_sq(p, Point([1]))
+
+
+def test_distance_is_nan_first_like_norm():
+    import math
+
+    p, q = Point([math.inf, math.nan]), Point([0.0, 0.0])
+    assert math.isnan(Vector([math.inf, math.nan]).norm())
+    assert math.isnan(GeometryUtils.distance(p, q))
+    assert GeometryUtils.distance(Point([math.inf, 1.0]), q) == math.inf
+    out = GeometryUtils.distance_batch([p, q], [q, Point([math.inf, 0.0])])
+    assert math.isnan(out[0][0]) and math.isnan(out[0][1])
+    assert out[1] == [0.0, math.inf]
@@ -0,0 +1,65 @@
+# tests/unit/maths/geometry/test_soa.py
+import math
+import random
+
+import pytest
+
+from algolib.exceptions import InvalidTypeError, InvalidValueError
+from algolib.maths.geometry import soa
+from algolib.maths.geometry.geometry import GeometryUtils, Plane, Point, Vector
+
+
+def _random_rows(rng, m, n):
+    return [[rng.uniform(-10, 10) for _ in range(n)] for _ in range(m)]
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 7])
+def test_kernels_match_object_api(n):
+    rng = random.Random(n)
+    a_rows, b_rows = _random_rows(rng, 50, n), _random_rows(rng, 50, n)
+    va = [Vector(r) for r in a_rows]
+    vb = [Vector(r) for r in b_rows]
+    pa = [Point(r) for r in a_rows]
+    pb = [Point(r) for r in b_rows]
+    a, b = soa.to_columns(va), soa.to_columns(pb)
+    assert a == soa.to_columns(pa) and len(a) == n and len(a[0]) == 50
+    assert soa.norms(a) == pytest.approx([v.norm() for v in va], rel=1e-15)
+    assert soa.dots(a, b) == pytest.approx(
+        [x.dot(y) for x, y in zip(va, vb)], rel=1e-12, abs=1e-12
+    )
+    assert soa.distances(a, b) == pytest.approx(
+        [GeometryUtils.distance(p, q) for p, q in zip(pa, pb)], rel=1e-15
+    )
+    normal, p0 = a_rows[0], b_rows[0]
+    plane = Plane(Point(p0), Vector(normal))
+    assert soa.plane_signed_distances(normal, p0, b) == pytest.approx(
+        [plane.signed_distance(p) for p in pb], rel=1e-12, abs=1e-12
+    )
+
+
+def test_kernels_validate_shapes_and_types():
+    with pytest.raises(InvalidValueError):
+        soa.norms([])
+    with pytest.raises(InvalidValueError):
+        soa.norms([[1.0, 2.0], [3.0]])
+    with pytest.raises(InvalidValueError):
+        soa.dots([[1.0], [2.0]], [[1.0]])
+    with pytest.raises(InvalidValueError):
+        soa.plane_signed_distances([0, 0], [0, 0], [[1.0], [2.0]])
+    with pytest.raises(InvalidValueError):
+        soa.to_columns([Point([1, 2]), Vector([1, 2, 3])])
+    with pytest.raises(InvalidTypeError):
+        soa.distances([["a"]], [[1.0]])
+    assert soa.norms([[3e300], [4e300]]) == [5e300]
+    assert math.isnan(soa.dots([[math.nan]], [[1]])[0])
+
+
+def test_plane_distances_with_tiny_normal_and_nonfinite_terms():
+    plane = Plane(Point([0.0]), Vector([5e-324]))
+    assert soa.plane_signed_distances([5e-324], [0.0], [[0.0, 2.0]]) == [
+        plane.signed_distance(Point([0.0])),
+        plane.signed_distance(Point([2.0])),
+    ]
+    # documented difference: 0 * inf is NaN here, 0 in Vector.dot
+    assert Vector([0.0, 1.0]).dot(Vector([math.inf, 2.0])) == 2.0
+    assert math.isnan(soa.dots([[0.0], [1.0]], [[math.inf], [2.0]])[0])
@@ -50,3 +50,95 @@ def slow_reference_is_prime(n: int) -> bool:
 def test_compare_with_reference_small_range():
     for n in range(0, 5000):
         assert is_prime(n) == slow_reference_is_prime(n)
+
+
+@pytest.mark.parametrize(
+    "n, expected",
+    [
+        (262139, True),  # largest prime below the Miller-Rabin cut-over
+        (262147, True),
+        (262144 + 1, False),
+        (2**31 - 1, True),
+        (10**12 + 39, True),
+        (2**61 - 1, True),
+        (2**64 - 59, True),  # largest 64-bit prime
+        (2**64 - 1, False),
+        (1000000007 * 1000000009, False),
+        (4294967291 * 4294967279, False),
+        # strong pseudoprimes to the smaller witness sets
+        (3215031751, False),
+        (341550071728321, False),
+        (3825123056546413051, False),
+        # Carmichael numbers
+        (561, False),
+        (41041, False),
+        (825265, False),
+        (321197185, False),
+    ],
+)
+def test_miller_rabin_range(n, expected):
+    assert is_prime(n) is expected
+
+
+def test_miller_rabin_matches_trial_division_around_cut_over():
+    from algolib.maths.number_theory.prime import _TRIAL_DIVISION_MAX
+
+    for n in range(_TRIAL_DIVISION_MAX - 2000, _TRIAL_DIVISION_MAX + 20000):
+        assert is_prime(n) == slow_reference_is_prime(n)
+
+
+def test_u64_bases_agree_with_prime_bases():
+    import random
+
+    from algolib.maths.number_theory.prime import _MR_PRIMES, _miller_rabin
+
+    def sprp_all(n):
+        # strong probable prime to every base 2..37: exact below 3.18e23
+        if any(n % p == 0 for p in _MR_PRIMES):
+            return False
+        d, s = n - 1, 0
+        while d % 2 == 0:
+            d, s = d // 2, s + 1
+        for a in _MR_PRIMES:
+            x = pow(a, d, n)
+            if x in (1, n - 1):
+                continue
+            for _ in range(s - 1):
+                x = x * x % n
+                if x == n - 1:
+                    break
+            else:
+                return False
+        return True
+
+    rng = random.Random(2024)
+    for _ in range(2000):
+        n = rng.randrange(341_550_071_728_321, 1 << 64) | 1
+        assert _miller_rabin(n) == sprp_all(n)
+
+
+def test_is_prime_bulk_matches_is_prime(monkeypatch):
+    from algolib.maths.number_theory import is_prime_bulk
+    from algolib.maths.number_theory import prime
+
+    monkeypatch.setattr(prime, "_sieve", bytearray())
+    monkeypatch.setattr(prime, "_SIEVE_MIN", 1000)
+    monkeypatch.setattr(prime, "_SIEVE_CAP", 5000)
+    assert is_prime_bulk([]) == []
+    ns = list(range(300)) + [997, 999]
+    expected = [slow_reference_is_prime(n) for n in ns]
+    assert is_prime_bulk(ns) == expected
+    assert len(prime._sieve) == 1000
+    # growth doubles and is capped; values beyond the cap are tested directly
+    ns = [1999, 2001, 4999, 4995, 7919, 2**61 - 1]
+    assert is_prime_bulk(iter(ns)) == [True, False, True, False, True, True]
+    assert len(prime._sieve) == 5000
+    assert all(is_prime(n) == slow_reference_is_prime(n) for n in range(5000))
+
+
+@pytest.mark.parametrize("bad, exc", [(1.0, InvalidTypeError), (-3, InvalidValueError)])
+def test_is_prime_bulk_validates_every_element(bad, exc):
+    from algolib.maths.number_theory import is_prime_bulk
+
+    with pytest.raises(exc):
+        is_prime_bulk([2, 3, bad])
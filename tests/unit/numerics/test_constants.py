@@ -123,6 +123,14 @@ def test_pow2_int_matches_builtin(k):
     assert got == builtin
 
 
+def test_pow2_int_table_is_exact_over_full_range():
+    for k in range(-1074, 1024):
+        assert C.pow2_int(k) == 2.0**k
+    assert C.pow2_int(-1075) == 0.0
+    assert len(C.POW2_TABLE) == 1074 + 1024
+    assert C.POW2_TABLE[1074] == 1.0
+
+
 @pytest.mark.parametrize(
     "x,y,expected",
     [
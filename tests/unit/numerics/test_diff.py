@@ -0,0 +1,31 @@
+# tests/unit/numerics/test_diff.py
+import math
+import pytest
+
+from algolib.numerics.diff import (
+    derivative_central,
+    derivative_central_batch,
+    derivative_cstep,
+)
+
+
+def test_derivative_central_matches_analytic():
+    assert derivative_central(math.sin, 0.7) == pytest.approx(math.cos(0.7), rel=1e-10)
+    assert derivative_central(math.exp, 3.0) == pytest.approx(math.exp(3.0), rel=1e-10)
+    assert derivative_central(lambda t: t * t, 5.0, max_iter=1) == pytest.approx(10.0)
+
+
+def test_derivative_central_batch_matches_scalar():
+    xs = [-2.0, 0.0, 0.5, 40.0]
+    assert derivative_central_batch(math.sin, xs) == [
+        derivative_central(math.sin, x) for x in xs
+    ]
+    assert derivative_central_batch(math.sin, xs, h=1e-2, max_iter=4) == [
+        derivative_central(math.sin, x, h=1e-2, max_iter=4) for x in xs
+    ]
+    assert derivative_central_batch(math.sin, []) == []
+
+
+def test_derivative_cstep():
+    d = derivative_cstep(lambda z: z**3, 2.0)
+    assert d == pytest.approx(12.0, rel=1e-15)
@@ -26,3 +26,17 @@ def test_exp_special_values(x, special_expected):
         assert math.isnan(result)
     else:
         assert result == special_expected
+
+
+def test_exp_within_one_ulp_including_extremes():
+    xs = [i * 0.37 - 745.0 for i in range(3928)] + [
+        709.782712893384,
+        709.78,
+        -745.1332191019411,
+        -708.4,
+        -1e-300,
+        1e-17,
+    ]
+    for x in xs:
+        expected = math.exp(x)
+        assert abs(exp(x) - expected) <= math.ulp(expected)
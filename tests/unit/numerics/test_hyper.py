@@ -104,3 +104,11 @@ def test_atanh_domain_and_zero():
 def test_atanh_nonfinite_nan():
     for bad in (float("nan"), float("inf"), -float("inf")):
         assert math.isnan(atanh(bad))
+
+
+def test_tanh_small_branches_are_accurate():
+    for x in [1e-300, 5e-9, 1e-6, 1e-3, 0.1, 0.3, 0.4499, 0.45, 0.6]:
+        for v in (x, -x):
+            t = math.tanh(v)
+            assert abs(tanh(v) - t) <= 9 * math.ulp(t)
+    assert abs(tanh(1e-6) - math.tanh(1e-6)) <= math.ulp(1e-6)
@@ -30,3 +30,42 @@ def test_log_1_equal0():
     # for any valid base, log(1, base) = 0
     for b in [2, 10, math.e]:
         assert log(1, b) == pytest.approx(0.0, abs=1e-18)
+
+
+def test_log_within_one_ulp_near_one_and_across_exponents():
+    xs = [1.0 + k * 1e-9 for k in range(-50, 51) if k] + [
+        5e-324,
+        1e-310,
+        0.7071067811865475,
+        0.7071067811865476,
+        1.4142135623730951,
+        3.7,
+        1e100,
+        1.7976931348623157e308,
+    ]
+    for x in xs:
+        assert abs(log(x) - math.log(x)) <= math.ulp(math.log(x))
+
+
+def test_log2_log10_exact_powers_and_specials():
+    from algolib.exceptions import InvalidTypeError, InvalidValueError
+    from algolib.numerics.log import log2
+
+    assert all(log2(2.0**k) == k for k in range(-1074, 1024))
+    assert all(log10(float(f"1e{k}")) == k for k in range(-307, 309))
+    assert log2(3.7) == pytest.approx(math.log2(3.7), rel=1e-15)
+    assert log2(math.inf) == math.inf and math.isnan(log10(math.nan))
+    for f in (log2, log10):
+        with pytest.raises(InvalidValueError):
+            f(0.0)
+        with pytest.raises(InvalidTypeError):
+            f("1")
+
+
+def test_log_base_is_cached():
+    from algolib.numerics.log import _ln_base
+
+    _ln_base.cache_clear()
+    assert log(49.0, 7) == pytest.approx(2.0, rel=1e-15)
+    assert log(343.0, 7) == pytest.approx(3.0, rel=1e-15)
+    assert _ln_base.cache_info().hits == 1
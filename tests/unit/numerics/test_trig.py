@@ -91,3 +91,36 @@ def test_non_finite_returns_nan(x):
     assert math.isnan(my_sin(x))
     assert math.isnan(my_cos(x))
     assert math.isnan(my_tan(x))
+
+
+def test_strict_backend_is_opt_in():
+    from algolib.numerics import get_backend_name
+
+    x = 1e5 + 0.3
+    assert my_tan(x) == math.tan(x)
+    try:
+        set_backend("strict")
+        assert get_backend_name() == "strict"
+        assert _isclose(my_tan(x), math.tan(math.remainder(x, C.TAU)), ulps=64)
+        assert my_sin(x) == math.sin(x)
+        assert math.isnan(my_tan(math.inf))
+    finally:
+        set_backend("system")
+
+
+def test_set_backend_rebinds_dispatch():
+    from algolib import numerics
+    from algolib.numerics import _backend
+
+    try:
+        set_backend("pure")
+        assert _backend.sin == _backend.get_backend().sin
+        assert numerics.sin is my_sin  # wrappers follow the switch
+        assert my_cos(0.25) == pytest.approx(math.cos(0.25), abs=1e-12)
+    finally:
+        set_backend("system")
+    assert (_backend.sin, _backend.cos, _backend.tan) == (
+        _backend.get_backend().sin,
+        _backend.get_backend().cos,
+        _backend.get_backend().tan,
+    )
@@ -0,0 +1,39 @@
+# tests/unit/test_exceptions.py
+import importlib
+
+import pytest
+
+import algolib.exceptions as exc
+
+# every module that imports from algolib.exceptions must bind the very same
+# class objects, otherwise ``except InvalidTypeError`` silently misses
+MODULES = [
+    "algolib.core.complex",
+    "algolib.core.complex_array",
+    "algolib.algorithms.rootfinding",
+    "algolib.maths.algebra.matrix_dense",
+    "algolib.maths.algebra.polynomial",
+    "algolib.maths.geometry.geometry",
+    "algolib.maths.number_theory.prime",
+    "algolib.numerics.constants",
+    "algolib.numerics.hyper",
+    "algolib.numerics.log",
+    "algolib.numerics.sqrt",
+    "algolib.numerics.stable",
+]
+
+
+@pytest.mark.parametrize("modname", MODULES)
+def test_exception_classes_are_shared(modname):
+    mod = importlib.import_module(modname)
+    shared = [name for name in exc.__all__ if hasattr(mod, name)]
+    assert shared
+    for name in shared:
+        assert getattr(mod, name) is getattr(exc, name)
+
+
+def test_hierarchy():
+    for name in exc.__all__:
+        assert issubclass(getattr(exc, name), exc.AlgolibError)
+    assert issubclass(exc.InvalidTypeError, TypeError)
+    assert issubclass(exc.InvalidValueError, ValueError)